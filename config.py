@@ -34,6 +34,7 @@ OTHER_BOT_USERNAME = os.getenv("OTHER_BOT_USERNAME", None)
 
 # Default locale - MUST be set in environment
 AVAILABLE_LOCALES = ["ru", "en"]
+SUPPORTED_LOCALES = frozenset(AVAILABLE_LOCALES)
 DEFAULT_LOCALE = os.getenv("DEFAULT_LOCALE")
 if not DEFAULT_LOCALE:
     raise ValueError(
@@ -171,6 +172,8 @@ USE_LOCAL_BOT_API = os.getenv("USE_LOCAL_BOT_API", "false").lower() == "true"
 REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "15"))
 RETRY_ATTEMPTS = int(os.getenv("RETRY_ATTEMPTS", "3"))
 RETRY_BACKOFF_SEC = int(os.getenv("RETRY_BACKOFF_SEC", "2"))
+# Max concurrent HTTP connections to the Bot API (httpx pool)
+CONNECTION_POOL_SIZE = int(os.getenv("CONNECTION_POOL_SIZE", "256"))
 
 
 # ========================================
@@ -338,6 +341,14 @@ async def post_init(application):
     except Exception as e:
         logger.error(f"Failed to configure alert service: {e}", exc_info=True)
 
+    # Start outgoing message queue
+    try:
+        from services.send_queue import send_queue
+        send_queue.set_bot(application.bot)
+        await send_queue.start()
+    except Exception as e:
+        logger.error(f"Failed to start send queue: {e}", exc_info=True)
+
     # Attach event loop to TelegramErrorHandler
     try:
         loop = asyncio.get_running_loop()
@@ -463,6 +474,9 @@ async def post_shutdown(application):
     await scheduler_service.stop()
     logger.info("Scheduler service stopped")
 
+    from services.send_queue import send_queue
+    await send_queue.stop()
+
     from storage.data_manager import data_manager
     data_manager.save()
     logger.info("Data saved on shutdown")
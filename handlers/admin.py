@@ -8,7 +8,6 @@ from utils.locale_helper import get_admin_language
 from services.tickets import ticket_service
 from services.bans import ban_manager
 from storage.data_manager import data_manager
-from storage.instruction_store import ADMIN_SCREEN_MESSAGES
 from utils.formatters import format_ticket_brief, format_ticket_card, format_ticket_preview
 from utils.admin_screen import show_admin_screen, reset_admin_screen, clear_all_admin_screens
 from utils.states import (
@@ -184,7 +183,10 @@ async def show_inbox(
 
 
 async def show_ticket_card(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, ticket_id: str
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    ticket_id: str,
+    ticket=None,
 ) -> None:
     """
     Display full ticket card for admin.
@@ -192,10 +194,13 @@ async def show_ticket_card(
     Shows full ticket details and context actions depending on ticket status:
     - New: Take in work, Close.
     - Working: Reply, Close.
+
+    Callers that already hold the ticket may pass it to skip the lookup.
     """
     user_lang = get_admin_language()
 
-    ticket = ticket_service.get_ticket(ticket_id)
+    if ticket is None:
+        ticket = ticket_service.get_ticket(ticket_id)
 
     if not ticket:
         await show_admin_screen(
@@ -279,7 +284,7 @@ async def stats_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         return
 
     stats = data_manager.get_stats()
-    banned_count = len(ban_manager.get_banned_list())
+    banned_count = ban_manager.get_banned_count()
     stats["banned_count"] = banned_count
 
     text = get_text("admin.stats_text", lang=user_lang, **stats)
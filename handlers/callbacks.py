@@ -1,7 +1,9 @@
+import asyncio
 import logging
 import os
+import weakref
+from functools import partial
 from pathlib import Path
-from zoneinfo import ZoneInfo
 from telegram import (
     Update,
     InlineKeyboardButton,
@@ -9,34 +11,55 @@ from telegram import (
     ReplyKeyboardRemove,
     __version__ as PTB_VERSION,
 )
+from telegram.error import BadRequest
 from telegram.ext import ContextTypes
 
 from config import (
     ADMIN_ID,
+    AVAILABLE_LOCALES,
     BACKUP_ENABLED,
-    BACKUP_FULL_PROJECT,
-    BACKUP_FILE_LIST,
     BACKUP_SEND_TO_TELEGRAM,
     BACKUP_MAX_SIZE_MB,
-    DEFAULT_LOCALE,
     RATING_ENABLED,
     ASK_MIN_LENGTH,
+    SUPPORTED_LOCALES,
+    BOT_NAME,
+    BOT_VERSION,
+    BOT_BUILD_DATE,
+    TIMEZONE_STR,
+    DEFAULT_LOCALE,
+    FEEDBACK_COOLDOWN_ENABLED,
+    DATA_DIR,
+    BACKUP_DIR,
+    LOG_FILE,
+    LOG_LEVEL,
+    STORAGE_BACKUP_INTERVAL_HOURS,
+    AUTO_CLOSE_AFTER_HOURS,
 )
-from locales import get_text, _
+from locales import get_text, has_html
 from utils.locale_helper import get_user_language, get_admin_language, set_user_language
 from services.tickets import ticket_service
 from services.bans import ban_manager
 from services.feedback import feedback_service
 from services.alerts import alert_service
+from services.backup import backup_service
+from services.send_queue import send_queue
 from storage.data_manager import data_manager
-from storage.instruction_store import ADMIN_SCREEN_MESSAGES, INSTRUCTION_MESSAGES
+from storage.ticket_cards import ticket_card_store
 from utils.keyboards import (
     get_rating_keyboard,
     get_settings_keyboard,
-    get_language_keyboard,
     get_user_language_keyboard,
+    get_back_to_settings_keyboard,
+    get_main_menu_keyboard,
+    get_rating_thanks_keyboard,
+    get_search_cancel_keyboard,
+    get_thanked_keyboard,
 )
-from utils.admin_screen import show_admin_screen
+from utils.admin_screen import show_admin_screen, render_admin_screen
+from handlers.admin import show_ticket_card, show_inbox, admin_help_handler
+from handlers.start import get_user_inline_menu, get_admin_inline_menu
+from handlers.user import send_or_update_ticket_card
 from utils.states import (
     STATE_AWAITING_QUESTION,
     STATE_AWAITING_SUGGESTION,
@@ -49,556 +72,656 @@ from utils.states import (
 
 logger = logging.getLogger(__name__)
 
+# Feedback kind -> (awaiting state, prompt key)
+FEEDBACK_FLOWS = {
+    "suggestion": (STATE_AWAITING_SUGGESTION, "messages.write_suggestion"),
+    "review": (STATE_AWAITING_REVIEW, "messages.write_review"),
+}
+
+# How often the manual backup screen is refreshed with progress (seconds)
+BACKUP_PROGRESS_INTERVAL_SEC = 2
+
+
+def _label(key: str, lang: str) -> str:
+    """Translation escaped for use inside a str.format template."""
+    return get_text(key, lang=lang).replace("{", "{{").replace("}", "}}")
+
+
+# Manual backup report templates per locale, assembled once from locale strings
+BACKUP_FULL_TEMPLATE = {
+    lang: (
+        f"{get_text('admin.backup_created_sent', lang=lang)}\n\n"
+        f"{_label('admin.backup_directory', lang)}: {{source_dir}}\n"
+        f"{_label('admin.backup_excluded', lang)}: {{excluded_patterns}}\n"
+        f"{_label('admin.backup_files', lang)}: {{files_in_archive}}\n"
+        f"{_label('admin.backup_size', lang)}: {{size_formatted}}\n"
+        f"{_label('admin.backup_file', lang)}: {{backup_filename}}"
+    )
+    for lang in AVAILABLE_LOCALES
+}
+BACKUP_PARTIAL_TEMPLATE = {
+    lang: (
+        f"{get_text('admin.backup_created_saved', lang=lang)}\n\n"
+        f"{_label('admin.backup_files_selected', lang)}: {{files}}\n"
+        f"{_label('admin.backup_in_archive', lang)}: {{files_in_archive}}\n"
+        f"{_label('admin.backup_size', lang)}: {{size_formatted}}\n"
+        f"{_label('admin.backup_file', lang)}: {{backup_filename}}"
+    )
+    for lang in AVAILABLE_LOCALES
+}
+BACKUP_TOO_LARGE_TEMPLATE = {
+    lang: (
+        f"{_label('admin.backup_too_large', lang)}\n\n"
+        "{details}\n\n"
+        f"{_label('admin.backup_size_info', lang)}: {{size}}\n"
+        f"{_label('admin.backup_limit', lang)}: {{limit}}MB\n"
+        f"{_label('admin.backup_saved_server', lang)}: /bot_data/backups/{{filename}}\n\n"
+        f"{_label('admin.backup_available', lang)}"
+    )
+    for lang in AVAILABLE_LOCALES
+}
+BACKUP_FAILED_TEMPLATE = {
+    lang: get_text("admin.backup_failed", lang=lang) for lang in AVAILABLE_LOCALES
+}
+
+
+class _BackupFields(dict):
+    """backup_info mapping that renders missing template fields as a dash."""
+
+    def __missing__(self, key: str) -> str:
+        return "—"
+
+
+def _format_backup_report(
+    backup_info: dict, lang: str, backup_filename: str, size_formatted: str
+) -> str:
+    """Fill manual backup report template for backup_service result."""
+    templates = (
+        BACKUP_FULL_TEMPLATE
+        if backup_info.get("type") == "full"
+        else BACKUP_PARTIAL_TEMPLATE
+    )
+    template = templates.get(lang, templates[DEFAULT_LOCALE])
+    fields = _BackupFields(backup_info)
+    # Headers (admin.backup_created_*) use {filename} and {size},
+    # detail lines use {backup_filename} and {size_formatted}
+    fields.update(
+        filename=backup_filename,
+        size=size_formatted,
+        size_formatted=size_formatted,
+        backup_filename=backup_filename,
+    )
+    return template.format_map(fields)
+
+
+# Callback actions whose handlers do I/O-heavy work (disk, several API calls);
+# they are dispatched as background tasks after the query is acknowledged
+BACKGROUND_ACTIONS = frozenset(
+    {"create_backup", "clear_tickets", "bans_list", "rate", "take", "close_confirm", "reply"}
+)
+
+
+# Callback actions only the admin can trigger; anyone else only gets the
+# query answered before the press is dropped
+ADMIN_ONLY_ACTIONS = frozenset(
+    {
+        "admin_inbox", "admin_stats", "admin_settings", "admin_help",
+        "admin_info", "admin_debug", "admin_home", "search_ticket_start",
+        "ban_user", "unban_user", "bans_list", "clear_tickets",
+        "create_backup", "change_language", "settings", "lang",
+        "ticket", "thank", "take", "close", "close_confirm", "close_cancel",
+        "reply", "reply_confirm", "reply_edit", "reply_cancel",
+        "inbox_filter", "inbox_page",
+    }
+)
+
+
+def _shows(message, text: str, keyboard, parse_mode: str | None = None) -> bool:
+    """True if message already displays this text and keyboard (edit would be a no-op)."""
+    if message.reply_markup != keyboard:
+        return False
+    shown = message.text_html if parse_mode == "HTML" else message.text
+    return shown == text
+
+
+# Per-user locks keeping button presses of one user in order; entries vanish
+# once no press holds or waits for the lock
+_USER_LOCKS: "weakref.WeakValueDictionary[int, asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _user_lock(user_id: int) -> asyncio.Lock:
+    """Get (or create) lock serializing callback actions of user."""
+    lock = _USER_LOCKS.get(user_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _USER_LOCKS[user_id] = lock
+    return lock
+
+
+async def _run_serialized(
+    lock: asyncio.Lock, handler, update, context, *args, held: bool = False
+) -> None:
+    """Run a callback handler under the user's lock (already acquired if held)."""
+    if not held:
+        await lock.acquire()
+    try:
+        await handler(update, context, *args)
+    finally:
+        lock.release()
+
 
 async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Main callback query handler - routes all button presses."""
     query = update.callback_query
     data = query.data
-    user = update.effective_user
-    user_lang = get_user_language(user.id)
+
+    # Disabled buttons: only dismiss the spinner, nothing else to do
+    if data == "noop":
+        try:
+            await query.answer()
+        except Exception:
+            pass
+        return
+
+    # "<action>:<args>" goes to the action's prefix handler with args split
+    # off; anything without a separator is an exact action name
+    action, sep, arg = data.partition(":")
+
+    if action in ADMIN_ONLY_ACTIONS and update.effective_user.id != ADMIN_ID:
+        logger.warning(
+            "Ignored admin callback %s from user %s", action, update.effective_user.id
+        )
+        # Still stop the client's loading spinner
+        try:
+            await query.answer()
+        except Exception:
+            pass
+        return
 
     try:
         await query.answer()
     except Exception as e:
         logger.warning("Failed to answer callback query: %s", e)
 
-    # Route to ticket view
-    if data.startswith("ticket:"):
-        ticket_id = data.split(":")[1]
-        from handlers.admin import show_ticket_card
-
-        await show_ticket_card(update, context, ticket_id)
+    if sep:
+        handler = PREFIX_HANDLERS.get(action)
+        args = (arg,)
+    else:
+        handler = EXACT_HANDLERS.get(data)
+        args = ()
+
+    if handler is not None:
+        lock = _user_lock(update.effective_user.id)
+        if lock.locked():
+            # An earlier press of this user is still running: wait for it off
+            # the update pipeline so other chats are not held up behind it
+            context.application.create_task(
+                _run_serialized(lock, handler, update, context, *args), update=update
+            )
+        elif action in BACKGROUND_ACTIONS:
+            # Already acknowledged above; take the lock now so later presses
+            # queue behind this one, and run the slow body in the background
+            await lock.acquire()
+            context.application.create_task(
+                _run_serialized(lock, handler, update, context, *args, held=True),
+                update=update,
+            )
+        else:
+            async with lock:
+                await handler(update, context, *args)
         return
 
-    # User can submit suggestion after rating
-    if data == "after_rate_suggestion":
-        context.user_data["state"] = STATE_AWAITING_SUGGESTION
-        context.user_data["skip_cooldown"] = True
-        await query.message.reply_text(
-            get_text("messages.write_suggestion", lang=user_lang)
-        )
-        return
+    logger.warning("Unknown callback data: %s", data)
 
-    # User can submit review after rating
-    elif data == "after_rate_review":
-        context.user_data["state"] = STATE_AWAITING_REVIEW
-        context.user_data["skip_cooldown"] = True
-        await query.message.reply_text(
-            get_text("messages.write_review", lang=user_lang)
-        )
-        return
 
-    # Delete feedback prompt message
-    elif data == "cancel_feedback_prompt":
-        try:
-            await query.delete_message()
-        except Exception as e:
-            logger.error("Failed to delete feedback prompt: %s", e)
-        return
+async def handle_ticket_view(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
+) -> None:
+    """Route to ticket view."""
+    ticket_id = arg
+    await show_ticket_card(update, context, ticket_id)
 
-    # Start question creation flow
-    elif data == "user_start_question":
-        await query.message.reply_text(
-            get_text(
-                "messages.describe_question",
-                lang=user_lang,
-                n=ASK_MIN_LENGTH,
-            )
-        )
-        context.user_data["state"] = STATE_AWAITING_QUESTION
-        return
 
-    # Start suggestion submission
-    elif data == "user_suggestion":
-        can_send, error_msg = feedback_service.check_cooldown(
-            user.id, "suggestion", user_lang
-        )
-        if not can_send:
-            context.user_data["state"] = None
-            await query.message.reply_text(error_msg)
-            return
+async def handle_cancel_feedback_prompt(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Delete feedback prompt message."""
+    query = update.callback_query
+
+    try:
+        await query.delete_message()
+    except Exception as e:
+        logger.error("Failed to delete feedback prompt: %s", e)
+
+
+async def handle_user_start_question(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Start question creation flow."""
+    query = update.callback_query
+    user = update.effective_user
+    user_lang = get_user_language(user.id)
 
-        context.user_data["state"] = STATE_AWAITING_SUGGESTION
-        await query.message.reply_text(
-            get_text("messages.write_suggestion", lang=user_lang)
+    await query.message.reply_text(
+        get_text(
+            "messages.describe_question",
+            lang=user_lang,
+            n=ASK_MIN_LENGTH,
         )
-        return
+    )
+    context.user_data["state"] = STATE_AWAITING_QUESTION
+
+
+async def handle_feedback_start(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    kind: str,
+    after_rating: bool = False,
+) -> None:
+    """Start suggestion/review submission (cooldown is skipped right after rating)."""
+    query = update.callback_query
+    user = update.effective_user
+    user_lang = get_user_language(user.id)
+    state, prompt_key = FEEDBACK_FLOWS[kind]
 
-    # Start review submission
-    elif data == "user_review":
+    if after_rating:
+        context.user_data["skip_cooldown"] = True
+    else:
         can_send, error_msg = feedback_service.check_cooldown(
-            user.id, "review", user_lang
+            user.id, kind, user_lang
         )
         if not can_send:
             context.user_data["state"] = None
             await query.message.reply_text(error_msg)
             return
 
-        context.user_data["state"] = STATE_AWAITING_REVIEW
-        await query.message.reply_text(
-            get_text("messages.write_review", lang=user_lang)
-        )
+    context.user_data["state"] = state
+    await query.message.reply_text(get_text(prompt_key, lang=user_lang))
+
+
+async def handle_user_change_language(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Show language selection menu for user."""
+    query = update.callback_query
+    user = update.effective_user
+    user_lang = get_user_language(user.id)
+
+    text = get_text("messages.choose_language", lang=user_lang)
+    keyboard = get_user_language_keyboard(user_lang)
+    if _shows(query.message, text, keyboard):
         return
 
-    # Show language selection menu for user
-    elif data == "user_change_language":
-        keyboard = get_user_language_keyboard(user_lang)
+    await query.edit_message_text(text, reply_markup=keyboard)
 
-        await query.edit_message_text(
-            get_text("messages.choose_language", lang=user_lang),
-            reply_markup=keyboard,
-        )
+
+async def handle_user_lang(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
+) -> None:
+    """Set user language and return to menu."""
+    query = update.callback_query
+    user = update.effective_user
+
+    locale = arg
+    if locale not in SUPPORTED_LOCALES:
+        logger.warning("Rejected unsupported locale %r from user %s", locale, user.id)
         return
 
-    # Set user language and return to menu
-    elif data.startswith("user_lang:"):
-        locale = data.split(":")[1]
+    set_user_language(user.id, locale)
 
-        set_user_language(user.id, locale)
+    # Confirmation and welcome menu in a single edit instead of edit + send
+    await query.edit_message_text(
+        text=(
+            f"{get_text('admin.language_changed', lang=locale)}\n\n"
+            f"{get_text('welcome.user', lang=locale, name=user.first_name or 'friend')}"
+        ),
+        reply_markup=get_user_inline_menu(locale),
+    )
 
-        await query.edit_message_text(
-            get_text("admin.language_changed", lang=locale)
-        )
 
-        from handlers.start import get_user_inline_menu
+async def handle_search_ticket_start(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Start ticket search."""
+    admin_lang = get_admin_language()
 
-        await context.bot.send_message(
-            chat_id=user.id,
-            text=get_text(
-                "welcome.user",
-                lang=locale,
-                name=user.first_name or "friend",
-            ),
-            reply_markup=get_user_inline_menu(locale),
-        )
-        return
+    text = get_text("search.prompt", lang=admin_lang)
+    keyboard = get_search_cancel_keyboard(admin_lang)
+    parse_mode = "HTML" if has_html("search.prompt") else None
+    message_id = None
 
-    # Start ticket search
-    elif data == "search_ticket_start":
-        if update.callback_query and update.callback_query.message:
-            current_msg_id = update.callback_query.message.message_id
+    query = update.callback_query
+    message = query.message if query else None
+    if message and _shows(message, text, keyboard, parse_mode):
+        message_id = message.message_id
+    elif message:
+        current_msg_id = message.message_id
 
-            try:
-                await context.bot.edit_message_text(
-                    chat_id=ADMIN_ID,
-                    message_id=current_msg_id,
-                    text=get_text("search.prompt", lang=user_lang),
-                    reply_markup=InlineKeyboardMarkup(
-                        [
-                            [
-                                InlineKeyboardButton(
-                                    text=get_text(
-                                        "search.button_cancel",
-                                        lang=user_lang,
-                                    ),
-                                    callback_data="admin_inbox",
-                                )
-                            ]
-                        ]
-                    ),
-                    parse_mode="HTML",
-                )
-                logger.info(
-                    "Updated search menu via edit: %s", current_msg_id
-                )
-                context.user_data["search_menu_msg_id"] = current_msg_id
-                context.user_data["state"] = STATE_SEARCH_TICKET_INPUT
-                return
-            except Exception as e:
-                error_msg = str(e)
-                if "Message is not modified" not in error_msg:
-                    logger.warning("Failed to edit search menu: %s", e)
-                else:
-                    context.user_data["search_menu_msg_id"] = current_msg_id
-                    context.user_data["state"] = STATE_SEARCH_TICKET_INPUT
-                    return
+        try:
+            await context.bot.edit_message_text(
+                chat_id=ADMIN_ID,
+                message_id=current_msg_id,
+                text=text,
+                reply_markup=keyboard,
+                parse_mode=parse_mode,
+            )
+            logger.info(
+                "Updated search menu via edit: %s", current_msg_id
+            )
+            message_id = current_msg_id
+        except BadRequest as e:
+            if e.message.startswith("Message is not modified"):
+                message_id = current_msg_id
+            else:
+                logger.warning("Failed to edit search menu: %s", e)
+        except Exception as e:
+            logger.warning("Failed to edit search menu: %s", e)
 
+    if message_id is None:
         msg = await context.bot.send_message(
             chat_id=ADMIN_ID,
-            text=get_text("search.prompt", lang=user_lang),
-            reply_markup=InlineKeyboardMarkup(
-                [
-                    [
-                        InlineKeyboardButton(
-                            text=get_text(
-                                "search.button_cancel", lang=user_lang
-                            ),
-                            callback_data="admin_inbox",
-                        )
-                    ]
-                ]
-            ),
+            text=text,
+            reply_markup=keyboard,
+            parse_mode=parse_mode,
         )
-        context.user_data["search_menu_msg_id"] = msg.message_id
-        context.user_data["state"] = STATE_SEARCH_TICKET_INPUT
-        logger.info("New search menu created: %s", msg.message_id)
-        return
+        message_id = msg.message_id
+        logger.info("New search menu created: %s", message_id)
 
-    # Show admin inbox
-    elif data == "admin_inbox":
-        await handle_admin_inbox(update, context)
-        return
+    context.user_data.update(
+        search_menu_msg_id=message_id, state=STATE_SEARCH_TICKET_INPUT
+    )
 
-    # Show admin statistics
-    elif data == "admin_stats":
-        await handle_admin_stats(update, context)
-        return
 
-    # Show admin settings
-    elif data == "admin_settings":
-        await handle_admin_settings(update, context)
-        return
+async def handle_ban_user(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Start ban user flow."""
+    context.user_data["state"] = STATE_AWAITING_BAN_USER_ID
+    await render_admin_screen(
+        update, context, "admin.enter_user_id", screen_type="settings"
+    )
 
-    # Show admin help (instructions + donate)
-    elif data == "admin_help":
-        from handlers.admin import admin_help_handler
 
-        await admin_help_handler(update, context)
-        return
+async def handle_unban_user(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Start unban user flow."""
+    context.user_data["state"] = STATE_AWAITING_UNBAN_USER_ID
+    await render_admin_screen(
+        update, context, "admin.enter_unban_id", screen_type="settings"
+    )
 
-    # Start ban user flow
-    elif data == "ban_user":
-        context.user_data["state"] = STATE_AWAITING_BAN_USER_ID
-        await show_admin_screen(
-            update,
-            context,
-            get_text("admin.enter_user_id", lang=user_lang),
-            None,
-            screen_type="settings",
-        )
-        return
 
-    # Start unban user flow
-    elif data == "unban_user":
-        context.user_data["state"] = STATE_AWAITING_UNBAN_USER_ID
-        await show_admin_screen(
-            update,
-            context,
-            get_text("admin.enter_unban_id", lang=user_lang),
-            None,
-            screen_type="settings",
-        )
-        return
+async def handle_clear_tickets(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Clear all active tickets."""
+    admin_lang = get_admin_language()
 
-    # Show banned users list
-    elif data == "bans_list":
-        await handle_bans_list(update, context)
-        return
+    count = ticket_service.clear_active_tickets()
+    keyboard = get_back_to_settings_keyboard(admin_lang)
+    await show_admin_screen(
+        update,
+        context,
+        get_text("admin.tickets_cleared", lang=admin_lang)
+        if count > 0
+        else get_text("admin.no_active_tickets", lang=admin_lang),
+        keyboard,
+        screen_type="settings",
+    )
 
-    # Clear all active tickets
-    elif data == "clear_tickets":
-        count = ticket_service.clear_active_tickets()
-        keyboard = InlineKeyboardMarkup(
-            [
-                [
-                    InlineKeyboardButton(
-                        get_text("buttons.back", lang=user_lang),
-                        callback_data="settings",
-                    )
-                ]
-            ]
-        )
-        await show_admin_screen(
+
+async def _show_settings(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, text: str, lang: str
+) -> None:
+    """Show text on the admin screen with the prebuilt settings keyboard."""
+    await show_admin_screen(
+        update, context, text, get_settings_keyboard(lang), screen_type="settings"
+    )
+
+
+async def handle_create_backup(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Create manual backup."""
+    admin_lang = get_admin_language()
+
+    if not BACKUP_ENABLED:
+        await render_admin_screen(
             update,
             context,
-            get_text("admin.tickets_cleared", lang=user_lang)
-            if count > 0
-            else get_text("admin.no_active_tickets", lang=user_lang),
-            keyboard,
+            "messages.backup_disabled_full",
+            "settings",
             screen_type="settings",
+            lang=admin_lang,
         )
         return
 
-    # Create manual backup
-    elif data == "create_backup":
-        from services.backup import backup_service
+    # The query was already answered by callback_handler, so the notice
+    # goes on the screen itself until the first progress update
+    await _show_settings(
+        update,
+        context,
+        get_text("messages.backup_creating", lang=admin_lang),
+        admin_lang,
+    )
 
-        admin_lang = get_admin_language()
+    progress = {"files": 0}
 
-        if not BACKUP_ENABLED:
-            await show_admin_screen(
-                update,
-                context,
-                get_text("messages.backup_disabled_full", lang=admin_lang),
-                get_settings_keyboard(admin_lang),
-                screen_type="settings",
-            )
-            return
+    def _on_progress(count: int) -> None:
+        progress["files"] = count
+
+    progress_task = context.application.create_task(
+        _report_backup_progress(update, context, progress, admin_lang)
+    )
 
+    try:
+        # Archiving runs in a worker thread so the event loop keeps serving updates
         try:
-            await query.answer(
-                get_text("messages.backup_creating", lang=admin_lang),
-                show_alert=False,
-            )
-        except Exception as e:
-            logger.warning(
-                "Failed to show backup creating notification: %s", e
+            backup_path, backup_info = await asyncio.to_thread(
+                backup_service.create_backup,
+                "manual",
+                _on_progress,
             )
+        finally:
+            progress_task.cancel()
 
-        try:
-            backup_path, backup_info = backup_service.create_backup()
+        if not backup_path:
+            raise RuntimeError("Backup path is empty")
 
-            if not backup_path:
-                raise RuntimeError("Backup path is empty")
+        backup_filename = backup_path.rpartition(os.sep)[2]
+        size_formatted = backup_info.get(
+            "size_formatted",
+            f"{backup_info.get('size_mb', 0):.1f}MB",
+        )
 
-            backup_filename = os.path.basename(backup_path)
-            size_formatted = backup_info.get(
-                "size_formatted",
-                f"{backup_info.get('size_mb', 0):.1f}MB",
-            )
+        logger.info(
+            "Manual backup created: %s (%s)",
+            backup_filename,
+            size_formatted,
+        )
 
-            logger.info(
-                "Manual backup created: %s (%s)",
-                backup_filename,
-                size_formatted,
-            )
+        message_text = _format_backup_report(
+            backup_info, admin_lang, backup_filename, size_formatted
+        )
 
-            if backup_info.get("type") == "full":
-                message_text = (
-                    f"{get_text('admin.backup_created_sent', lang=admin_lang).format(filename=backup_filename, size=size_formatted)}\n\n"
-                    f"{get_text('admin.backup_directory', lang=admin_lang)}: {backup_info.get('source_dir')}\n"
-                    f"{get_text('admin.backup_excluded', lang=admin_lang)}: {backup_info.get('excluded_patterns')}\n"
-                    f"{get_text('admin.backup_files', lang=admin_lang)}: {backup_info.get('files_in_archive')}\n"
-                    f"{get_text('admin.backup_size', lang=admin_lang)}: {size_formatted}\n"
-                    f"{get_text('admin.backup_file', lang=admin_lang)}: {backup_filename}"
+        if BACKUP_SEND_TO_TELEGRAM:
+            size_mb = backup_info.get("size_mb", 0)
+            if size_mb <= BACKUP_MAX_SIZE_MB:
+                caption = message_text
+                await alert_service.send_backup_file(
+                    backup_path, caption
+                )
+                logger.info(
+                    "Backup sent to Telegram: %s (%s)",
+                    backup_filename,
+                    size_formatted,
                 )
             else:
-                message_text = (
-                    f"{get_text('admin.backup_created_saved', lang=admin_lang).format(filename=backup_filename, size=size_formatted)}\n\n"
-                    f"{get_text('admin.backup_files_selected', lang=admin_lang)}: {backup_info.get('files')}\n"
-                    f"{get_text('admin.backup_in_archive', lang=admin_lang)}: {backup_info.get('files_in_archive')}\n"
-                    f"{get_text('admin.backup_size', lang=admin_lang)}: {size_formatted}\n"
-                    f"{get_text('admin.backup_file', lang=admin_lang)}: {backup_filename}"
+                message_text = BACKUP_TOO_LARGE_TEMPLATE.get(
+                    admin_lang, BACKUP_TOO_LARGE_TEMPLATE[DEFAULT_LOCALE]
+                ).format(
+                    details=message_text,
+                    size=size_formatted,
+                    limit=BACKUP_MAX_SIZE_MB,
+                    filename=backup_filename,
+                )
+                logger.warning(
+                    "Backup too large to send to Telegram: %s (%s > %sMB)",
+                    backup_filename,
+                    size_formatted,
+                    BACKUP_MAX_SIZE_MB,
                 )
 
-            if BACKUP_SEND_TO_TELEGRAM:
-                size_mb = backup_info.get("size_mb", 0)
-                if size_mb <= BACKUP_MAX_SIZE_MB:
-                    caption = message_text
-                    await alert_service.send_backup_file(
-                        backup_path, caption
-                    )
-                    logger.info(
-                        "Backup sent to Telegram: %s (%s)",
-                        backup_filename,
-                        size_formatted,
-                    )
-                else:
-                    warning_msg = (
-                        f"{get_text('admin.backup_too_large', lang=admin_lang)}\n\n"
-                        f"{message_text}\n\n"
-                        f"{get_text('admin.backup_size_info', lang=admin_lang)}: {size_formatted}\n"
-                        f"{get_text('admin.backup_limit', lang=admin_lang)}: {BACKUP_MAX_SIZE_MB}MB\n"
-                        f"{get_text('admin.backup_saved_server', lang=admin_lang)}: /bot_data/backups/{backup_filename}\n\n"
-                        f"{get_text('admin.backup_available', lang=admin_lang)}"
-                    )
-                    message_text = warning_msg
-                    logger.warning(
-                        "Backup too large to send to Telegram: %s (%s > %sMB)",
-                        backup_filename,
-                        size_formatted,
-                        BACKUP_MAX_SIZE_MB,
-                    )
-
-            await show_admin_screen(
-                update,
-                context,
-                message_text,
-                get_settings_keyboard(admin_lang),
-                screen_type="settings",
-            )
-
-        except Exception as e:
-            logger.error("Manual backup failed: %s", e, exc_info=True)
-            admin_lang = get_admin_language()
-            await show_admin_screen(
-                update,
-                context,
-                get_text(
-                    "admin.backup_failed",
-                    lang=admin_lang,
-                    error=str(e),
-                ),
-                get_settings_keyboard(admin_lang),
-                screen_type="settings",
-            )
-        return
-
-    # Show language selection menu for admin
-    elif data == "change_language":
-        await show_admin_screen(
-            update,
-            context,
-            get_text("admin.choose_language", lang=user_lang),
-            get_language_keyboard(user_lang),
-            screen_type="settings",
-        )
-        return
+        await _show_settings(update, context, message_text, admin_lang)
 
-    # Show admin settings menu
-    elif data == "settings":
-        await show_admin_screen(
+    except Exception as e:
+        logger.error("Manual backup failed: %s", e, exc_info=True)
+        await _show_settings(
             update,
             context,
-            get_text("admin.settings", lang=user_lang),
-            get_settings_keyboard(user_lang),
-            screen_type="settings",
+            BACKUP_FAILED_TEMPLATE.get(
+                admin_lang, BACKUP_FAILED_TEMPLATE[DEFAULT_LOCALE]
+            ).format(error=e),
+            admin_lang,
         )
-        return
 
-    # Set admin language
-    elif data.startswith("lang:"):
-        locale = data.split(":")[1]
 
-        set_user_language(ADMIN_ID, locale)
+async def handle_change_language(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Show language selection menu for admin."""
+    await render_admin_screen(
+        update, context, "admin.choose_language", "language", screen_type="settings"
+    )
 
-        await show_admin_screen(
-            update,
-            context,
-            get_text("admin.language_changed", lang=locale),
-            get_settings_keyboard(locale),
-            screen_type="settings",
-        )
-        return
 
-    # Admin info screen
-    elif data == "admin_info":
-        await handle_admin_info(update, context)
-        return
+async def handle_settings(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Show admin settings menu."""
+    await render_admin_screen(
+        update, context, "admin.settings", "settings", screen_type="settings"
+    )
 
-    # Admin debug screen
-    elif data == "admin_debug":
-        await handle_admin_debug(update, context)
-        return
 
-    # Handle ticket rating
-    elif data.startswith("rate:"):
-        if RATING_ENABLED:
-            await handle_rating(update, context, data)
-        else:
-            await update.callback_query.answer(
-                "Rating feature is disabled", show_alert=True
-            )
+async def handle_admin_lang(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
+) -> None:
+    """Set admin language."""
+    locale = arg
+    if locale not in SUPPORTED_LOCALES:
+        logger.warning("Rejected unsupported admin locale %r", locale)
         return
 
-    # Handle thank you for feedback
-    elif data.startswith("thank:"):
-        await handle_thank_feedback(update, context, data)
-        return
+    set_user_language(ADMIN_ID, locale)
 
-    # Handle admin taking ticket
-    elif data.startswith("take:"):
-        await handle_take_ticket(update, context, data)
-        return
+    await render_admin_screen(
+        update,
+        context,
+        "admin.language_changed",
+        "settings",
+        screen_type="settings",
+        lang=locale,
+    )
 
-    # Handle ticket closing (step 1: ask confirm)
-    elif data.startswith("close:"):
-        await handle_close_confirm(update, context, data)
-        return
 
-    # Handle ticket closing (step 2: confirmed)
-    elif data.startswith("close_confirm:"):
-        await handle_close_ticket(update, context, data)
-        return
+async def handle_rate(
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
+) -> None:
+    """Handle ticket rating."""
+    if RATING_ENABLED:
+        ticket_id, _, rating = arg.partition(":")
+        await handle_rating(update, context, ticket_id, int(rating))
+    else:
+        await update.callback_query.answer(
+            "Rating feature is disabled", show_alert=True
+        )
 
-    # Handle cancel close
-    elif data.startswith("close_cancel:"):
-        await handle_close_cancel(update, context, data)
-        return
 
-    # Handle admin reply to ticket (enter reply mode)
-    elif data.startswith("reply:"):
-        await handle_reply_ticket(update, context, data)
-        return
+async def handle_admin_home(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Return to admin home menu."""
+    user = update.effective_user
+    query = update.callback_query
+    message = query.message if query else None
 
-    # Handle admin reply confirm (send to user)
-    elif data.startswith("reply_confirm:"):
-        await handle_reply_confirm(update, context, data)
-        return
+    admin_lang = get_admin_language()
+    text = get_text("admin.welcome", lang=admin_lang)
+    keyboard = get_admin_inline_menu(admin_lang)
+    parse_mode = "HTML" if has_html("admin.welcome") else None
 
-    # Handle admin reply edit (re-enter text)
-    elif data.startswith("reply_edit:"):
-        await handle_reply_edit(update, context, data)
+    if message and _shows(message, text, keyboard, parse_mode):
         return
 
-    # Handle admin reply cancel
-    elif data.startswith("reply_cancel:"):
-        await handle_reply_cancel(update, context, data)
-        return
+    if message:
+        try:
+            await context.bot.edit_message_text(
+                chat_id=user.id,
+                message_id=message.message_id,
+                text=text,
+                reply_markup=keyboard,
+                parse_mode=parse_mode,
+            )
+            logger.info("Updated admin home menu: %s", message.message_id)
+            return
+        except BadRequest as e:
+            if e.message.startswith("Message is not modified"):
+                return
+            logger.warning("Failed to edit admin home: %s", e)
+        except Exception as e:
+            logger.warning("Failed to edit admin home: %s", e)
 
-    # Handle inbox filtering
-    elif data.startswith("inbox_filter:"):
-        await handle_inbox_filter(update, context, data)
-        return
+    await show_admin_screen(update, context, text, keyboard, screen_type="home")
 
-    # Handle inbox pagination
-    elif data.startswith("inbox_page:"):
-        await handle_inbox_page(update, context, data)
-        return
 
-    # Return to admin home menu
-    elif data == "admin_home":
-        admin_lang = get_admin_language()
+async def handle_user_home(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Return to user home menu."""
+    query = update.callback_query
+    user = update.effective_user
+    user_lang = get_user_language(user.id)
 
-        if update.callback_query and update.callback_query.message:
-            try:
-                from handlers.start import get_admin_inline_menu
-
-                await context.bot.edit_message_text(
-                    chat_id=user.id,
-                    message_id=update.callback_query.message.message_id,
-                    text=get_text("admin.welcome", lang=admin_lang),
-                    reply_markup=get_admin_inline_menu(admin_lang),
-                    parse_mode="HTML",
-                )
-                logger.info(
-                    "Updated admin home menu: %s",
-                    update.callback_query.message.message_id,
-                )
-                return
-            except Exception as e:
-                error_msg = str(e)
-                if "Message is not modified" not in error_msg:
-                    logger.warning("Failed to edit admin home: %s", e)
-                else:
-                    return
+    await query.message.reply_text(
+        get_text(
+            "welcome.user",
+            lang=user_lang,
+            name=query.from_user.first_name or "friend",
+        ),
+        reply_markup=get_user_inline_menu(user_lang),
+    )
 
-        from handlers.start import get_admin_inline_menu
 
-        await show_admin_screen(
+async def _report_backup_progress(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    progress: dict,
+    admin_lang: str,
+) -> None:
+    """Periodically refresh settings screen while manual backup is running."""
+    reported = None
+    while True:
+        await asyncio.sleep(BACKUP_PROGRESS_INTERVAL_SEC)
+        count = progress["files"]
+        if count == reported:
+            continue
+        reported = count
+        await _show_settings(
             update,
             context,
-            get_text("admin.welcome", lang=admin_lang),
-            get_admin_inline_menu(admin_lang),
-            screen_type="home",
-        )
-        return
-
-    # Return to user home menu
-    elif data == "user_home":
-        from handlers.start import get_user_inline_menu
-
-        await query.message.reply_text(
-            get_text(
-                "welcome.user",
-                lang=user_lang,
-                name=query.from_user.first_name or "friend",
-            ),
-            reply_markup=get_user_inline_menu(user_lang),
+            get_text("messages.backup_progress", lang=admin_lang, count=count),
+            admin_lang,
         )
-        return
-
-    # No operation - used for disabled buttons
-    elif data == "noop":
-        return
 
 
 async def handle_admin_inbox(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> None:
     """Display incoming tickets for admin."""
-    from handlers.admin import show_inbox
-
     await show_inbox(update, context)
 
 
@@ -609,21 +732,12 @@ async def handle_admin_stats(
     admin_lang = get_admin_language()
 
     stats = data_manager.get_stats()
-    banned_count = len(ban_manager.get_banned_list())
+    banned_count = ban_manager.get_banned_count()
     stats["banned_count"] = banned_count
 
     text = get_text("admin.stats_text", lang=admin_lang, **stats)
 
-    keyboard = InlineKeyboardMarkup(
-        [
-            [
-                InlineKeyboardButton(
-                    get_text("buttons.main_menu", lang=admin_lang),
-                    callback_data="admin_home",
-                )
-            ]
-        ]
-    )
+    keyboard = get_main_menu_keyboard(admin_lang)
 
     await show_admin_screen(update, context, text, keyboard, screen_type="stats")
 
@@ -633,17 +747,12 @@ async def handle_admin_settings(
 ) -> None:
     """Display settings menu."""
     user = update.effective_user
-    admin_lang = get_admin_language()
 
     if user.id != ADMIN_ID:
         return
 
-    await show_admin_screen(
-        update,
-        context,
-        get_text("admin.settings", lang=admin_lang),
-        get_settings_keyboard(admin_lang),
-        screen_type="settings",
+    await render_admin_screen(
+        update, context, "admin.settings", "settings", screen_type="settings"
     )
 
 
@@ -657,23 +766,15 @@ async def handle_bans_list(
     if not banned_users:
         text = get_text("admin.no_banned_users", lang=admin_lang)
     else:
-        text = get_text("admin.banned_users_list", lang=admin_lang) + "\n\n"
-        for user_id, reason in banned_users:
-            text += f"🚫 ID: <code>{user_id}</code>\n"
-            if reason:
-                text += f"   Reason: {reason}\n"
-            text += "\n"
+        rows = "\n\n".join(
+            "🚫 ID: <code>%s</code>\n   Reason: %s" % (user_id, reason)
+            if reason
+            else "🚫 ID: <code>%s</code>" % user_id
+            for user_id, reason in banned_users
+        )
+        text = f"{get_text('admin.banned_users_list', lang=admin_lang)}\n\n{rows}"
 
-    keyboard = InlineKeyboardMarkup(
-        [
-            [
-                InlineKeyboardButton(
-                    get_text("buttons.back", lang=admin_lang),
-                    callback_data="settings",
-                )
-            ]
-        ]
-    )
+    keyboard = get_back_to_settings_keyboard(admin_lang)
 
     await show_admin_screen(update, context, text, keyboard, screen_type="settings")
 
@@ -685,18 +786,6 @@ async def handle_admin_info(
     admin_lang = get_admin_language()
     stats = data_manager.get_stats()
 
-    from config import (
-        BOT_NAME,
-        BOT_VERSION,
-        BOT_BUILD_DATE,
-        TIMEZONE_STR,
-        DEFAULT_LOCALE,
-        BACKUP_ENABLED,
-        BACKUP_SEND_TO_TELEGRAM,
-        RATING_ENABLED,
-        FEEDBACK_COOLDOWN_ENABLED,
-    )
-
     text = get_text(
         "admin.info_text",
         lang=admin_lang,
@@ -714,16 +803,7 @@ async def handle_admin_info(
         ptb_version=PTB_VERSION,
     )
 
-    keyboard = InlineKeyboardMarkup(
-        [
-            [
-                InlineKeyboardButton(
-                    get_text("buttons.back", lang=admin_lang),
-                    callback_data="settings",
-                )
-            ]
-        ]
-    )
+    keyboard = get_back_to_settings_keyboard(admin_lang)
 
     await show_admin_screen(update, context, text, keyboard, screen_type="settings")
 
@@ -734,15 +814,6 @@ async def handle_admin_debug(
     """Show debug/config info for admin."""
     admin_lang = get_admin_language()
 
-    from config import (
-        DATA_DIR,
-        BACKUP_DIR,
-        LOG_FILE,
-        LOG_LEVEL,
-        STORAGE_BACKUP_INTERVAL_HOURS,
-        AUTO_CLOSE_AFTER_HOURS,
-    )
-
     data_json_path = Path(DATA_DIR) / "data.json"
     if data_json_path.exists():
         data_size_mb = data_json_path.stat().st_size / (1024 * 1024)
@@ -774,34 +845,25 @@ async def handle_admin_debug(
         last_backup=last_backup_name,
     )
 
-    keyboard = InlineKeyboardMarkup(
-        [
-            [
-                InlineKeyboardButton(
-                    get_text("buttons.back", lang=admin_lang),
-                    callback_data="settings",
-                )
-            ]
-        ]
-    )
+    keyboard = get_back_to_settings_keyboard(admin_lang)
 
     await show_admin_screen(update, context, text, keyboard, screen_type="settings")
 
 
 async def handle_rating(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    ticket_id: str,
+    rating: int,
 ) -> None:
     """Handle ticket rating from user with clickable ticket ID and username/id in alert."""
-    parts = data.split(":")
-    ticket_id = parts[1]
-    rating = int(parts[2])
-
+    query = update.callback_query
     user = update.effective_user
     user_lang = get_user_language(user.id)
 
     ticket = ticket_service.get_ticket(ticket_id)
     if not ticket:
-        await update.callback_query.answer(
+        await query.answer(
             get_text("errors.ticket_not_found", lang=user_lang),
             show_alert=True,
         )
@@ -810,30 +872,9 @@ async def handle_rating(
     ticket_service.rate_ticket(ticket_id, rating)
     logger.info("User %s rated ticket %s: %s/5", user.id, ticket_id, rating)
 
-    await update.callback_query.edit_message_text(
+    await query.edit_message_text(
         get_text("messages.thanks_for_rating", lang=user_lang),
-        reply_markup=InlineKeyboardMarkup(
-            [
-                [
-                    InlineKeyboardButton(
-                        get_text("buttons.write_suggestion", lang=user_lang),
-                        callback_data="after_rate_suggestion",
-                    )
-                ],
-                [
-                    InlineKeyboardButton(
-                        get_text("buttons.write_review", lang=user_lang),
-                        callback_data="after_rate_review",
-                    )
-                ],
-                [
-                    InlineKeyboardButton(
-                        get_text("buttons.cancel", lang=user_lang),
-                        callback_data="cancel_feedback_prompt",
-                    )
-                ],
-            ]
-        ),
+        reply_markup=get_rating_thanks_keyboard(user_lang),
     )
 
     username = f"@{user.username}" if user.username else "unknown"
@@ -857,26 +898,24 @@ async def handle_rating(
         ]
     )
 
-    try:
-        await context.bot.send_message(
-            chat_id=ADMIN_ID, text=alert_text, reply_markup=keyboard
-        )
-        logger.info(
-            "Rating alert sent to admin %s: %s rated %s/5 by user %s",
-            ADMIN_ID,
-            ticket_id,
-            rating,
-            user.id,
-        )
-    except Exception as e:
-        logger.error("Failed to send rating alert to admin: %s", e)
+    # User already sees the thank-you screen; don't make them wait for the alert
+    send_queue.post(
+        "send_message", chat_id=ADMIN_ID, text=alert_text, reply_markup=keyboard
+    )
+    logger.info(
+        "Rating alert queued for admin %s: %s rated %s/5 by user %s",
+        ADMIN_ID,
+        ticket_id,
+        rating,
+        user.id,
+    )
 
 
 async def handle_thank_feedback(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
 ) -> None:
     """Handle thanking user for feedback - with button state change and type-specific message."""
-    feedback_id = data.split(":")[1]
+    feedback_id = arg
     admin_lang = get_admin_language()
 
     feedback = feedback_service.get_feedback(feedback_id)
@@ -906,28 +945,17 @@ async def handle_thank_feedback(
                 "messages.admin_thanked_feedback", lang=user_lang
             )
 
-        await context.bot.send_message(chat_id=user_id, text=thank_message)
+        send_queue.post("send_message", chat_id=user_id, text=thank_message)
         logger.info(
-            "Thank you message sent to user %s for %s", user_id, feedback_type
+            "Thank you message queued for user %s for %s", user_id, feedback_type
         )
 
         if message_id:
             try:
-                inactive_keyboard = InlineKeyboardMarkup(
-                    [
-                        [
-                            InlineKeyboardButton(
-                                get_text("admin.thanked", lang=admin_lang),
-                                callback_data="noop",
-                            )
-                        ]
-                    ]
-                )
-
                 await context.bot.edit_message_reply_markup(
                     chat_id=ADMIN_ID,
                     message_id=message_id,
-                    reply_markup=inactive_keyboard,
+                    reply_markup=get_thanked_keyboard(admin_lang),
                 )
                 logger.info(
                     "Feedback button updated to disabled: %s", feedback_id
@@ -953,10 +981,10 @@ async def handle_thank_feedback(
 
 
 async def handle_take_ticket(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
 ) -> None:
     """Handle admin taking a ticket and notify user."""
-    ticket_id = data.split(":")[1]
+    ticket_id = arg
     admin_lang = get_admin_language()
 
     ticket = ticket_service.get_ticket(ticket_id)
@@ -972,43 +1000,26 @@ async def handle_take_ticket(
     ticket_service.take_ticket(ticket_id, admin_id)
     logger.info("Admin %s took ticket %s", admin_id, ticket_id)
 
-    try:
-        user_id = ticket.user_id
-        user_lang = get_user_language(user_id)
-
-        user_text = get_text(
-            "messages.ticket_taken_in_work",
-            lang=user_lang,
-            ticket_id=ticket_id,
-        )
-
-        await alert_service.send_user_message(
-            user_id=user_id,
-            text=user_text,
-        )
-        logger.info(
-            "Notified user %s that ticket %s was taken in work",
-            user_id,
-            ticket_id,
-        )
-    except Exception as e:
-        logger.error(
-            "Failed to notify user about ticket %s being taken in work: %s",
-            ticket_id,
-            e,
-            exc_info=True,
-        )
+    user_id = ticket.user_id
+    user_text = get_text(
+        "messages.ticket_taken_in_work",
+        lang=get_user_language(user_id),
+        ticket_id=ticket_id,
+    )
 
-    from handlers.admin import show_ticket_card
+    send_queue.post("send_message", chat_id=user_id, text=user_text)
+    logger.info(
+        "Ticket %s taken in work, notice queued for user %s", ticket_id, user_id
+    )
 
     await show_ticket_card(update, context, ticket_id)
 
 
 async def handle_close_confirm(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
 ) -> None:
     """Show confirmation dialog before closing a ticket."""
-    ticket_id = data.split(":")[1]
+    ticket_id = arg
     admin_lang = get_admin_language()
 
     ticket = ticket_service.get_ticket(ticket_id)
@@ -1050,20 +1061,18 @@ async def handle_close_confirm(
 
 
 async def handle_close_cancel(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
 ) -> None:
     """Cancel close confirmation and show ticket card again."""
-    ticket_id = data.split(":")[1]
-    from handlers.admin import show_ticket_card
-
+    ticket_id = arg
     await show_ticket_card(update, context, ticket_id)
 
 
 async def handle_close_ticket(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
 ) -> None:
     """Handle closing a ticket."""
-    ticket_id = data.split(":")[1]
+    ticket_id = arg
     admin_lang = get_admin_language()
 
     ticket = ticket_service.get_ticket(ticket_id)
@@ -1074,48 +1083,47 @@ async def handle_close_ticket(
         )
         return
 
-    ticket_service.close_ticket(ticket_id)
+    ticket = ticket_service.close_ticket(ticket_id) or ticket
+    ticket_card_store.pop(ticket_id)
     logger.info("Ticket %s closed by admin", ticket_id)
 
     user_id = ticket.user_id
     user_lang = get_user_language(user_id)
 
-    try:
-        if RATING_ENABLED:
-            await context.bot.send_message(
-                chat_id=user_id,
-                text=get_text(
-                    "messages.ticket_closed_rate",
-                    lang=user_lang,
-                ).format(ticket_id=ticket_id),
-                reply_markup=get_rating_keyboard(ticket_id, user_lang),
-            )
-        else:
-            await context.bot.send_message(
-                chat_id=user_id,
-                text=get_text(
-                    "messages.ticket_closed", lang=user_lang
-                ).format(ticket_id=ticket_id),
-            )
-    except Exception as e:
-        logger.error(
-            "Failed to notify user about ticket closure: %s", e
+    # User notification is independent of the admin-side card refresh
+    if RATING_ENABLED:
+        send_queue.post(
+            "send_message",
+            chat_id=user_id,
+            text=get_text(
+                "messages.ticket_closed_rate",
+                lang=user_lang,
+            ).format(ticket_id=ticket_id),
+            reply_markup=get_rating_keyboard(ticket_id, user_lang),
+        )
+    else:
+        send_queue.post(
+            "send_message",
+            chat_id=user_id,
+            text=get_text(
+                "messages.ticket_closed", lang=user_lang
+            ).format(ticket_id=ticket_id),
         )
 
     await update.callback_query.answer(
         get_text("admin.ticket_closed", lang=admin_lang), show_alert=False
     )
 
-    from handlers.admin import show_ticket_card
-
-    await show_ticket_card(update, context, ticket_id)
+    # Re-render from the closed ticket we already hold; the message currently
+    # shows the close confirmation, so a markup-only edit would leave it stale
+    await show_ticket_card(update, context, ticket_id, ticket=ticket)
 
 
 async def handle_reply_ticket(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
 ) -> None:
     """Handle admin reply to ticket."""
-    ticket_id = data.split(":")[1]
+    ticket_id = arg
     admin_lang = get_admin_language()
 
     ticket = ticket_service.get_ticket(ticket_id)
@@ -1126,8 +1134,7 @@ async def handle_reply_ticket(
         )
         return
 
-    context.user_data["reply_ticket_id"] = ticket_id
-    context.user_data["state"] = STATE_AWAITING_REPLY
+    context.user_data.update(reply_ticket_id=ticket_id, state=STATE_AWAITING_REPLY)
 
     user_id = ticket.user_id
     username = getattr(ticket, "username", None)
@@ -1149,10 +1156,10 @@ async def handle_reply_ticket(
 
 
 async def handle_reply_confirm(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
 ) -> None:
     """Confirm admin reply and send message to user."""
-    ticket_id = data.split(":")[1]
+    ticket_id = arg
     admin_lang = get_admin_language()
 
     ticket = ticket_service.get_ticket(ticket_id)
@@ -1183,9 +1190,7 @@ async def handle_reply_confirm(
 
     user_lang = get_user_language(ticket.user_id)
 
-    context.user_data["state"] = None
-    context.user_data["reply_ticket_id"] = None
-    context.user_data["pending_reply_text"] = None
+    context.user_data.update(state=None, reply_ticket_id=None, pending_reply_text=None)
 
     await update.callback_query.message.reply_text(
         get_text(
@@ -1195,20 +1200,14 @@ async def handle_reply_confirm(
         )
     )
 
-    try:
-        await context.bot.send_message(
-            chat_id=ticket.user_id,
-            text=f"{get_text('messages.admin_reply', lang=user_lang)}\n\n{text}",
-            reply_markup=ReplyKeyboardRemove(),
-        )
-    except Exception as e:
-        logger.error(
-            "Failed to send message to user %s: %s", ticket.user_id, e
-        )
-
-    from handlers.user import TICKET_CARD_MESSAGES, send_or_update_ticket_card
+    send_queue.post(
+        "send_message",
+        chat_id=ticket.user_id,
+        text=f"{get_text('messages.admin_reply', lang=user_lang)}\n\n{text}",
+        reply_markup=ReplyKeyboardRemove(),
+    )
 
-    message_id = TICKET_CARD_MESSAGES.get(ticket_id)
+    message_id = ticket_card_store.get(ticket_id)
     await send_or_update_ticket_card(
         context, ticket_id, action="working", message_id=message_id
     )
@@ -1217,10 +1216,10 @@ async def handle_reply_confirm(
 
 
 async def handle_reply_edit(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
 ) -> None:
     """Return admin to reply input, allowing to change text."""
-    ticket_id = data.split(":")[1]
+    ticket_id = arg
     admin_lang = get_admin_language()
 
     ticket = ticket_service.get_ticket(ticket_id)
@@ -1231,9 +1230,9 @@ async def handle_reply_edit(
         )
         return
 
-    context.user_data["state"] = STATE_AWAITING_REPLY
-    context.user_data["reply_ticket_id"] = ticket_id
-    context.user_data["pending_reply_text"] = None
+    context.user_data.update(
+        state=STATE_AWAITING_REPLY, reply_ticket_id=ticket_id, pending_reply_text=None
+    )
 
     user_id = ticket.user_id
     username = getattr(ticket, "username", None)
@@ -1255,48 +1254,87 @@ async def handle_reply_edit(
 
 
 async def handle_reply_cancel(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
 ) -> None:
     """Cancel admin reply sending, keep admin message as draft."""
-    ticket_id = data.split(":")[1]
+    ticket_id = arg
     admin_lang = get_admin_language()
 
-    context.user_data["state"] = None
-    context.user_data["reply_ticket_id"] = None
-    context.user_data["pending_reply_text"] = None
+    context.user_data.update(state=None, reply_ticket_id=None, pending_reply_text=None)
 
     await update.callback_query.answer(
         get_text("buttons.cancel", lang=admin_lang),
         show_alert=False,
     )
 
-    from handlers.admin import show_ticket_card
     await show_ticket_card(update, context, ticket_id)
 
 
 async def handle_inbox_filter(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
 ) -> None:
     """Handle inbox filtering by ticket status."""
-    filter_status = data.split(":")[1]
-
-    context.user_data["inbox_filter"] = filter_status
-    context.user_data["inbox_page"] = 0
+    filter_status = arg
 
-    from handlers.admin import show_inbox
+    context.user_data.update(inbox_filter=filter_status, inbox_page=0)
 
     await show_inbox(update, context, status_filter=filter_status)
 
 
 async def handle_inbox_page(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, data: str
+    update: Update, context: ContextTypes.DEFAULT_TYPE, arg: str
 ) -> None:
     """Handle inbox pagination."""
-    page = int(data.split(":")[1])
+    page = int(arg)
 
     context.user_data["inbox_page"] = page
     current_filter = context.user_data.get("inbox_filter", "all")
 
-    from handlers.admin import show_inbox
-
     await show_inbox(update, context, status_filter=current_filter, page=page)
+
+
+# Callback routing tables, see callback_handler()
+EXACT_HANDLERS = {
+    "after_rate_suggestion": partial(handle_feedback_start, kind="suggestion", after_rating=True),
+    "after_rate_review": partial(handle_feedback_start, kind="review", after_rating=True),
+    "cancel_feedback_prompt": handle_cancel_feedback_prompt,
+    "user_start_question": handle_user_start_question,
+    "user_suggestion": partial(handle_feedback_start, kind="suggestion"),
+    "user_review": partial(handle_feedback_start, kind="review"),
+    "user_change_language": handle_user_change_language,
+    "search_ticket_start": handle_search_ticket_start,
+    "admin_inbox": handle_admin_inbox,
+    "admin_stats": handle_admin_stats,
+    "admin_settings": handle_admin_settings,
+    "admin_help": admin_help_handler,
+    "ban_user": handle_ban_user,
+    "unban_user": handle_unban_user,
+    "bans_list": handle_bans_list,
+    "clear_tickets": handle_clear_tickets,
+    "create_backup": handle_create_backup,
+    "change_language": handle_change_language,
+    "settings": handle_settings,
+    "admin_info": handle_admin_info,
+    "admin_debug": handle_admin_debug,
+    "admin_home": handle_admin_home,
+    "user_home": handle_user_home,
+}
+
+# Keyed by the action before the first ":" in callback data
+PREFIX_HANDLERS = {
+    "ticket": handle_ticket_view,
+    "user_lang": handle_user_lang,
+    "lang": handle_admin_lang,
+    "rate": handle_rate,
+    "thank": handle_thank_feedback,
+    "take": handle_take_ticket,
+    "close": handle_close_confirm,
+    "close_confirm": handle_close_ticket,
+    "close_cancel": handle_close_cancel,
+    "reply": handle_reply_ticket,
+    "reply_confirm": handle_reply_confirm,
+    "reply_edit": handle_reply_edit,
+    "reply_cancel": handle_reply_cancel,
+    "inbox_filter": handle_inbox_filter,
+    "inbox_page": handle_inbox_page,
+}
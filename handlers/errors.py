@@ -1,5 +1,6 @@
 import logging
 import asyncio
+import random
 from telegram import Update
 from telegram.ext import ContextTypes
 from telegram.error import BadRequest, RetryAfter, TimedOut, NetworkError
@@ -8,54 +9,94 @@ from config import RETRY_ATTEMPTS, RETRY_BACKOFF_SEC
 logger = logging.getLogger(__name__)
 
 
+async def _reply_error_notice(update: Update, text: str) -> None:
+    """Tell the user something went wrong; never raises."""
+    if update and update.effective_message:
+        try:
+            await update.effective_message.reply_text(text)
+        except Exception:
+            # Avoid raising from the error handler itself
+            pass
+
+
+async def _on_retry_after(update: Update, error: RetryAfter) -> None:
+    logger.warning("RetryAfter: %ss", error.retry_after)
+    await asyncio.sleep(error.retry_after)
+
+
+async def _on_timed_out(update: Update, error: TimedOut) -> None:
+    logger.warning("Request timed out")
+
+
+async def _on_network_error(update: Update, error: NetworkError) -> None:
+    logger.error("Network error: %s", error, exc_info=error)
+
+
+async def _on_bad_request(update: Update, error: BadRequest) -> None:
+    logger.error("Bad request: %s", error, exc_info=error)
+    await _reply_error_notice(update, "⚠️ An error occurred while processing the request.")
+
+
+async def _on_unexpected(update: Update, error: Exception) -> None:
+    # Log unexpected errors with traceback
+    logger.error("Unexpected error: %s", error, exc_info=error)
+
+    # Do NOT send alert here: TelegramErrorHandler will handle alerts.
+    # Only inform the user that something went wrong.
+    await _reply_error_notice(
+        update, "❌ An unexpected error occurred. Administrator has been notified."
+    )
+
+
+# Exception type -> handler; subclasses resolve through the MRO
+_ERROR_HANDLERS = {
+    RetryAfter: _on_retry_after,
+    TimedOut: _on_timed_out,
+    BadRequest: _on_bad_request,
+    NetworkError: _on_network_error,
+}
+
+
 async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Global error handler used by PTB for all uncaught exceptions."""
-    try:
-        # Re-raise the original error so we can handle by type
-        raise context.error
-    except RetryAfter as e:
-        logger.warning("RetryAfter: %ss", e.retry_after)
-        await asyncio.sleep(e.retry_after)
-    except TimedOut:
-        logger.warning("Request timed out")
-    except NetworkError as e:
-        logger.error("Network error: %s", e, exc_info=True)
-    except BadRequest as e:
-        logger.error("Bad request: %s", e, exc_info=True)
-        if update and update.effective_message:
-            try:
-                await update.effective_message.reply_text(
-                    "⚠️ An error occurred while processing the request."
-                )
-            except Exception:
-                # Avoid raising from the error handler itself
-                pass
-    except Exception as e:
-        # Log unexpected errors with traceback
-        logger.error("Unexpected error: %s", e, exc_info=True)
-
-        # Do NOT send alert here: TelegramErrorHandler will handle alerts.
-        # Only inform the user that something went wrong.
-        if update and update.effective_message:
-            try:
-                await update.effective_message.reply_text(
-                    "❌ An unexpected error occurred. Administrator has been notified."
-                )
-            except Exception:
-                # Avoid raising from the error handler itself
-                pass
+    error = context.error
+    for cls in type(error).__mro__:
+        handler = _ERROR_HANDLERS.get(cls)
+        if handler is not None:
+            break
+    else:
+        handler = _on_unexpected
+
+    await handler(update, error)
+
+
+# Errors worth retrying; anything else propagates immediately
+_RETRIABLE = (TimedOut, NetworkError)
+
+# Precomputed exponential backoff per attempt (seconds, before jitter)
+_BACKOFFS = tuple(RETRY_BACKOFF_SEC * (2**attempt) for attempt in range(RETRY_ATTEMPTS))
+
+# Caps how many retry attempts may hit Telegram at once after a network blip
+RETRY_CONCURRENCY = 16
+_RETRY_SEMAPHORE = asyncio.Semaphore(RETRY_CONCURRENCY)
 
 
 async def retry_on_error(func, *args, **kwargs):
-    """Retry function execution on network-related errors with exponential backoff."""
+    """Retry function execution on network-related errors with jittered exponential backoff."""
+    last_attempt = RETRY_ATTEMPTS - 1
     for attempt in range(RETRY_ATTEMPTS):
         try:
-            return await func(*args, **kwargs)
-        except (TimedOut, NetworkError) as e:
-            if attempt < RETRY_ATTEMPTS - 1:
-                wait_time = RETRY_BACKOFF_SEC * (2**attempt)
+            if attempt == 0:
+                return await func(*args, **kwargs)
+            # Only retries are capped; first attempts never wait on the semaphore
+            async with _RETRY_SEMAPHORE:
+                return await func(*args, **kwargs)
+        except _RETRIABLE as e:
+            if attempt < last_attempt:
+                # Jitter spreads concurrent retries instead of firing them together
+                wait_time = _BACKOFFS[attempt] * random.uniform(0.5, 1.5)
                 logger.warning(
-                    "Attempt %d failed, retrying in %ss: %s",
+                    "Attempt %d failed, retrying in %.1fs: %s",
                     attempt + 1,
                     wait_time,
                     e,
@@ -64,6 +105,3 @@ async def retry_on_error(func, *args, **kwargs):
             else:
                 logger.error("All %d attempts failed", RETRY_ATTEMPTS, exc_info=True)
                 raise
-        except Exception:
-            # For non-network errors just re-raise
-            raise
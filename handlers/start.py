@@ -1,15 +1,46 @@
 import logging
+import time
+from collections import OrderedDict
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardRemove
 from telegram.ext import ContextTypes
-from config import ADMIN_ID, OTHER_BOT_USERNAME, DEFAULT_LOCALE
-from locales import get_text, set_user_locale, set_locale
+from config import ADMIN_ID, OTHER_BOT_USERNAME, DEFAULT_LOCALE, AVAILABLE_LOCALES
+from locales import get_text
+from utils.locale_helper import get_user_language
 from services.bans import ban_manager
-from storage.data_manager import data_manager
 
 logger = logging.getLogger(__name__)
 
+# Button label keys used by the inline menus
+MENU_LABEL_KEYS = (
+    "buttons.ask_question",
+    "buttons.suggestion",
+    "buttons.review",
+    "buttons.change_language",
+    "buttons.back_to_service",
+    "buttons.inbox",
+    "buttons.stats",
+    "buttons.settings",
+    "buttons.admin_help",
+)
 
-def get_user_inline_menu(user_lang: str | None = None) -> InlineKeyboardMarkup:
+
+def _load_menu_labels() -> dict[str, dict[str, str]]:
+    """Resolve menu button labels for every available locale."""
+    return {
+        lang: {key: get_text(key, lang=lang) for key in MENU_LABEL_KEYS}
+        for lang in AVAILABLE_LOCALES
+    }
+
+
+# {lang: {label_key: text}}
+_MENU_LABELS = _load_menu_labels()
+
+
+def _menu_labels(user_lang: str | None) -> dict[str, str]:
+    return _MENU_LABELS.get(user_lang) or _MENU_LABELS[DEFAULT_LOCALE]
+
+
+def _build_user_menu(user_lang: str | None = None) -> InlineKeyboardMarkup:
     """
     Build inline menu for regular user.
 
@@ -20,36 +51,36 @@ def get_user_inline_menu(user_lang: str | None = None) -> InlineKeyboardMarkup:
     - Change language
     - Back to main service bot
     """
-    user_lang = user_lang or DEFAULT_LOCALE
+    labels = _menu_labels(user_lang)
     return InlineKeyboardMarkup(
         [
             [
                 InlineKeyboardButton(
-                    get_text("buttons.ask_question", lang=user_lang),
+                    labels["buttons.ask_question"],
                     callback_data="user_start_question",
                 )
             ],
             [
                 InlineKeyboardButton(
-                    get_text("buttons.suggestion", lang=user_lang),
+                    labels["buttons.suggestion"],
                     callback_data="user_suggestion",
                 )
             ],
             [
                 InlineKeyboardButton(
-                    get_text("buttons.review", lang=user_lang),
+                    labels["buttons.review"],
                     callback_data="user_review",
                 )
             ],
             [
                 InlineKeyboardButton(
-                    get_text("buttons.change_language", lang=user_lang),
+                    labels["buttons.change_language"],
                     callback_data="user_change_language",
                 )
             ],
             [
                 InlineKeyboardButton(
-                    get_text("buttons.back_to_service", lang=user_lang),
+                    labels["buttons.back_to_service"],
                     url=f"https://t.me/{OTHER_BOT_USERNAME}",
                 )
             ],
@@ -57,7 +88,7 @@ def get_user_inline_menu(user_lang: str | None = None) -> InlineKeyboardMarkup:
     )
 
 
-def get_admin_inline_menu(user_lang: str | None = None) -> InlineKeyboardMarkup:
+def _build_admin_menu(user_lang: str | None = None) -> InlineKeyboardMarkup:
     """
     Build inline menu for admin.
 
@@ -67,30 +98,30 @@ def get_admin_inline_menu(user_lang: str | None = None) -> InlineKeyboardMarkup:
     - Settings
     - Help (instructions + donate button)
     """
-    user_lang = user_lang or DEFAULT_LOCALE
+    labels = _menu_labels(user_lang)
     return InlineKeyboardMarkup(
         [
             [
                 InlineKeyboardButton(
-                    get_text("buttons.inbox", lang=user_lang),
+                    labels["buttons.inbox"],
                     callback_data="admin_inbox",
                 )
             ],
             [
                 InlineKeyboardButton(
-                    get_text("buttons.stats", lang=user_lang),
+                    labels["buttons.stats"],
                     callback_data="admin_stats",
                 )
             ],
             [
                 InlineKeyboardButton(
-                    get_text("buttons.settings", lang=user_lang),
+                    labels["buttons.settings"],
                     callback_data="admin_settings",
                 )
             ],
             [
                 InlineKeyboardButton(
-                    get_text("buttons.admin_help", lang=user_lang),
+                    labels["buttons.admin_help"],
                     callback_data="admin_help",
                 )
             ],
@@ -98,17 +129,86 @@ def get_admin_inline_menu(user_lang: str | None = None) -> InlineKeyboardMarkup:
     )
 
 
+# Repeated /start from the same user within this window is ignored
+START_DEDUP_SEC = 2.0
+START_DEDUP_MAX_USERS = 10_000
+
+# {user_id: monotonic time of last handled /start}, oldest first
+_RECENT_STARTS: "OrderedDict[int, float]" = OrderedDict()
+
+
+def _is_repeated_start(user_id: int) -> bool:
+    """Record /start from user; True if one was already handled just now."""
+    now = time.monotonic()
+    last = _RECENT_STARTS.get(user_id)
+    if last is not None and now - last < START_DEDUP_SEC:
+        return True
+
+    _RECENT_STARTS[user_id] = now
+    _RECENT_STARTS.move_to_end(user_id)
+    if len(_RECENT_STARTS) > START_DEDUP_MAX_USERS:
+        _RECENT_STARTS.popitem(last=False)
+    return False
+
+
+# {lang: InlineKeyboardMarkup}; prebuilt for AVAILABLE_LOCALES at import
+_USER_MENU_CACHE: dict[str, InlineKeyboardMarkup] = {}
+_ADMIN_MENU_CACHE: dict[str, InlineKeyboardMarkup] = {}
+
+
+def get_user_inline_menu(user_lang: str | None = None) -> InlineKeyboardMarkup:
+    """Inline menu for regular user (built once per locale)."""
+    user_lang = user_lang or DEFAULT_LOCALE
+    menu = _USER_MENU_CACHE.get(user_lang)
+    if menu is None:
+        menu = _USER_MENU_CACHE[user_lang] = _build_user_menu(user_lang)
+    return menu
+
+
+def get_admin_inline_menu(user_lang: str | None = None) -> InlineKeyboardMarkup:
+    """Inline menu for admin (built once per locale)."""
+    user_lang = user_lang or DEFAULT_LOCALE
+    menu = _ADMIN_MENU_CACHE.get(user_lang)
+    if menu is None:
+        menu = _ADMIN_MENU_CACHE[user_lang] = _build_admin_menu(user_lang)
+    return menu
+
+
+def clear_menu_cache() -> None:
+    """Rebuild cached menus and labels (call after locales reload)."""
+    global _MENU_LABELS
+    _MENU_LABELS = _load_menu_labels()
+    _USER_MENU_CACHE.clear()
+    _ADMIN_MENU_CACHE.clear()
+    _prebuild_menus()
+
+
+def _prebuild_menus() -> None:
+    """Build both menus for every available locale up front."""
+    for lang in AVAILABLE_LOCALES:
+        get_user_inline_menu(lang)
+        get_admin_inline_menu(lang)
+
+
+_prebuild_menus()
+
+
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
     Handle /start command.
 
     - If user is banned: show banned message.
-    - Load saved user locale from data_manager.
+    - Resolve user's saved locale (cached).
     - For admin: show admin inline menu.
     - For regular user: show user inline menu.
     """
     user = update.effective_user
 
+    # Drop rapid duplicate /start (spam, double taps) before any API call
+    if _is_repeated_start(user.id):
+        logger.debug("Ignored repeated /start from user %s", user.id)
+        return
+
     # Check ban first
     if ban_manager.is_banned(user.id):
         await update.message.reply_text(
@@ -117,12 +217,8 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         )
         return
 
-    # Load user's saved locale (or default)
-    user_data = data_manager.get_user_data(user.id)
-    user_locale = user_data.get("locale", DEFAULT_LOCALE)
-
-    set_user_locale(user.id, user_locale)
-    set_locale(user_locale)
+    # Saved locale (or default); also registers new users in storage
+    user_locale = get_user_language(user.id)
 
     # Admin branch
     if user.id == ADMIN_ID:
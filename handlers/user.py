@@ -1,15 +1,21 @@
+import asyncio
 import logging
+import weakref
+from functools import lru_cache
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardRemove
 from telegram.ext import ContextTypes
-from config import ADMIN_ID, ASK_MIN_LENGTH, ENABLE_MEDIA_FROM_USERS, DEFAULT_LOCALE
+from config import ADMIN_ID, ASK_MIN_LENGTH, ENABLE_MEDIA_FROM_USERS
 from locales import get_text
-from utils.locale_helper import get_user_language, get_admin_language, set_user_language
+from utils.locale_helper import get_user_language, get_admin_language
 from services.tickets import ticket_service
 from services.feedback import feedback_service
 from services.bans import ban_manager
 from storage.data_manager import data_manager
-from utils.keyboards import get_rating_keyboard
+from services.send_queue import send_queue
+from storage.ticket_cards import ticket_card_store
 from utils.formatters import format_ticket_card
+from handlers.admin import admin_text_handler
+from handlers.start import get_user_inline_menu
 from utils.states import (
     STATE_AWAITING_QUESTION,
     STATE_AWAITING_SUGGESTION,
@@ -19,8 +25,192 @@ from utils.states import (
 
 logger = logging.getLogger(__name__)
 
-# Storage for ticket card message_ids for editing
-TICKET_CARD_MESSAGES: dict[str, int] = {}
+# Per-ticket locks keeping admin notifications for one ticket in order;
+# entries disappear once no task holds the lock
+_TICKET_LOCKS: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _ticket_lock(ticket_id: str) -> asyncio.Lock:
+    """Get (or create) lock serializing admin-side updates for ticket."""
+    lock = _TICKET_LOCKS.get(ticket_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _TICKET_LOCKS[ticket_id] = lock
+    return lock
+
+
+async def _refresh_card_for_message(
+    context: ContextTypes.DEFAULT_TYPE,
+    ticket_id: str,
+) -> None:
+    """Refresh ticket card after new user message."""
+    lock = _ticket_lock(ticket_id)
+    async with lock:
+        message_id = ticket_card_store.get(ticket_id)
+        await send_or_update_ticket_card(
+            context, ticket_id, action="message", message_id=message_id
+        )
+
+
+async def _notify_admin_of_message(
+    context: ContextTypes.DEFAULT_TYPE,
+    ticket_id: str,
+    text: str,
+) -> None:
+    """Send short notifying alert about user follow-up in ticket."""
+    lock = _ticket_lock(ticket_id)
+    async with lock:
+        admin_lang = get_admin_language()
+        keyboard = InlineKeyboardMarkup(
+            [
+                [
+                    InlineKeyboardButton(
+                        _card_strings(admin_lang)["buttons"]["open"],
+                        callback_data=f"ticket:{ticket_id}",
+                    )
+                ]
+            ]
+        )
+        try:
+            await context.bot.send_message(
+                chat_id=ADMIN_ID,
+                text=text,
+                reply_markup=keyboard,
+            )
+        except Exception as e:
+            logger.error("Failed to send message to admin: %s", e)
+
+
+# Debounce for card refreshes caused by user messages: a burst of messages
+# into one ticket results in a single card edit
+CARD_REFRESH_DELAY = 0.8
+# Flush right away once this many refreshes were coalesced
+CARD_REFRESH_MAX_PENDING = 5
+
+# {ticket_id: (timer handle, coalesced refresh count)}
+_pending_card_refresh: dict[str, tuple[asyncio.TimerHandle, int]] = {}
+
+
+def _flush_card_refresh(
+    context: ContextTypes.DEFAULT_TYPE, ticket_id: str
+) -> None:
+    """Run pending card refresh for ticket now."""
+    pending = _pending_card_refresh.pop(ticket_id, None)
+    if pending is not None:
+        pending[0].cancel()
+    context.application.create_task(
+        _refresh_card_for_message(context, ticket_id)
+    )
+
+
+def _schedule_card_refresh(
+    context: ContextTypes.DEFAULT_TYPE, ticket_id: str
+) -> None:
+    """Schedule debounced card refresh for ticket."""
+    pending = _pending_card_refresh.get(ticket_id)
+    count = 1
+    if pending is not None:
+        pending[0].cancel()
+        count = pending[1] + 1
+
+    if count >= CARD_REFRESH_MAX_PENDING:
+        _flush_card_refresh(context, ticket_id)
+        return
+
+    handle = asyncio.get_running_loop().call_later(
+        CARD_REFRESH_DELAY, _flush_card_refresh, context, ticket_id
+    )
+    _pending_card_refresh[ticket_id] = (handle, count)
+
+
+# Card header locale key per action
+CARD_HEADER_KEYS = {
+    "new": "notifications.new_ticket",
+    "message": "notifications.new_message",
+    "working": "notifications.ticket_in_progress",
+    "closed": "notifications.ticket_closed",
+}
+
+# Admin-side button locale keys (ticket card, reply preview, feedback)
+CARD_BUTTON_KEYS = {
+    "take": "buttons.take",
+    "close": "buttons.close",
+    "reply": "buttons.reply",
+    "open": "search.button_open",
+    "main_menu": "buttons.main_menu",
+    "confirm_reply_yes": "admin.confirm_reply_yes",
+    "confirm_reply_edit": "admin.confirm_reply_edit",
+    "confirm_reply_no": "admin.confirm_reply_no",
+    "thank_suggestion": "admin.thank_suggestion",
+    "thank_review": "admin.thank_review",
+}
+
+
+@lru_cache(maxsize=8)
+def _card_strings(lang: str) -> dict[str, dict[str, str]]:
+    """Admin-side headers and button labels for locale (clear after locales reload)."""
+    return {
+        "headers": {
+            action: get_text(key, lang=lang)
+            for action, key in CARD_HEADER_KEYS.items()
+        },
+        "buttons": {
+            name: get_text(key, lang=lang)
+            for name, key in CARD_BUTTON_KEYS.items()
+        },
+    }
+
+
+def _card_keyboard(
+    ticket_id: str, status: str, show_open: bool, lang: str
+) -> InlineKeyboardMarkup:
+    """Ticket card keyboard; labels come from the per-locale _card_strings cache."""
+    labels = _card_strings(lang)["buttons"]
+
+    buttons: list[list[InlineKeyboardButton]] = []
+
+    if status == "new":
+        buttons.append(
+            [
+                InlineKeyboardButton(
+                    labels["take"], callback_data=f"take:{ticket_id}"
+                ),
+                InlineKeyboardButton(
+                    labels["close"], callback_data=f"close:{ticket_id}"
+                ),
+            ]
+        )
+    elif status == "working":
+        buttons.append(
+            [
+                InlineKeyboardButton(
+                    labels["reply"], callback_data=f"reply:{ticket_id}"
+                ),
+                InlineKeyboardButton(
+                    labels["close"], callback_data=f"close:{ticket_id}"
+                ),
+            ]
+        )
+
+    if show_open:
+        buttons.append(
+            [
+                InlineKeyboardButton(
+                    labels["open"], callback_data=f"ticket:{ticket_id}"
+                )
+            ]
+        )
+
+    buttons.append(
+        [
+            InlineKeyboardButton(
+                labels["main_menu"], callback_data="admin_home"
+            )
+        ]
+    )
+    return InlineKeyboardMarkup(buttons)
 
 
 async def send_or_update_ticket_card(
@@ -30,68 +220,41 @@ async def send_or_update_ticket_card(
     message_id: int | None = None,
 ) -> None:
     """Send or update ticket card to admin."""
-    try:
-        ticket = None
-        for t in data_manager.get_all_tickets():
-            if t.id == ticket_id:
-                ticket = t
-                break
+    if action != "message":
+        # This render already shows latest state and carries a more
+        # meaningful header than a pending debounced "new message" one
+        pending = _pending_card_refresh.pop(ticket_id, None)
+        if pending is not None:
+            pending[0].cancel()
 
+    try:
+        ticket = data_manager.get_ticket(ticket_id)
         if not ticket:
             logger.error("Ticket %s not found", ticket_id)
             return
 
         admin_lang = get_admin_language()
+        strings = _card_strings(admin_lang)
 
         text = format_ticket_card(ticket)
 
-        if action == "new":
-            text = f"{get_text('notifications.new_ticket', lang=admin_lang)}\n\n{text}"
-        elif action == "message":
-            text = f"{get_text('notifications.new_message', lang=admin_lang)}\n\n{text}"
-        elif action == "working":
-            text = f"{get_text('notifications.ticket_in_progress', lang=admin_lang)}\n\n{text}"
-        elif action == "closed":
-            text = f"{get_text('notifications.ticket_closed', lang=admin_lang)}\n\n{text}"
+        header = strings["headers"].get(action)
+        if header:
+            text = f"{header}\n\n{text}"
 
-        buttons: list[list[InlineKeyboardButton]] = []
+        keyboard_key = (ticket.status, action == "message", admin_lang)
+        signature = (text, keyboard_key)
 
-        if ticket.status == "new":
-            buttons.append(
-                [
-                    InlineKeyboardButton(
-                        get_text("buttons.take", lang=admin_lang),
-                        callback_data=f"take:{ticket_id}",
-                    ),
-                    InlineKeyboardButton(
-                        get_text("buttons.close", lang=admin_lang),
-                        callback_data=f"close:{ticket_id}",
-                    ),
-                ]
-            )
-        elif ticket.status == "working":
-            buttons.append(
-                [
-                    InlineKeyboardButton(
-                        get_text("buttons.reply", lang=admin_lang),
-                        callback_data=f"reply:{ticket_id}",
-                    ),
-                    InlineKeyboardButton(
-                        get_text("buttons.close", lang=admin_lang),
-                        callback_data=f"close:{ticket_id}",
-                    ),
-                ]
-            )
+        if (
+            message_id
+            and ticket_card_store.get(ticket_id) == message_id
+            and ticket_card_store.get_signature(ticket_id) == signature
+        ):
+            # Telegram rejects edits that change nothing
+            logger.debug("Ticket card unchanged, skipping edit: %s", ticket_id)
+            return
 
-        buttons.append(
-            [
-                InlineKeyboardButton(
-                    get_text("buttons.main_menu", lang=admin_lang),
-                    callback_data="admin_home",
-                )
-            ]
-        )
-        keyboard = InlineKeyboardMarkup(buttons)
+        keyboard = _card_keyboard(ticket_id, *keyboard_key)
 
         if message_id:
             try:
@@ -101,7 +264,7 @@ async def send_or_update_ticket_card(
                     text=text,
                     reply_markup=keyboard,
                 )
-                TICKET_CARD_MESSAGES[ticket_id] = message_id
+                ticket_card_store.set(ticket_id, message_id, signature)
                 logger.info("Updated ticket card (edited): %s", ticket_id)
                 return
             except Exception as e:
@@ -110,7 +273,7 @@ async def send_or_update_ticket_card(
         msg = await context.bot.send_message(
             chat_id=ADMIN_ID, text=text, reply_markup=keyboard
         )
-        TICKET_CARD_MESSAGES[ticket_id] = msg.message_id
+        ticket_card_store.set(ticket_id, msg.message_id, signature)
         logger.info("Ticket card sent to admin: %s", ticket_id)
 
     except Exception as e:
@@ -237,18 +400,11 @@ async def text_message_handler(
 
     state = context.user_data.get("state")
 
-    if state == STATE_AWAITING_QUESTION:
-        await handle_question_text(update, context, text)
-    elif state == STATE_AWAITING_SUGGESTION:
-        await handle_suggestion_text(update, context, text)
-    elif state == STATE_AWAITING_REVIEW:
-        await handle_review_text(update, context, text)
-    elif state == STATE_AWAITING_REPLY:
-        await handle_admin_reply(update, context, text)
+    state_handler = _STATE_DISPATCH.get(state)
+    if state_handler is not None:
+        await state_handler(update, context, text, user_lang)
     else:
         if user.id == ADMIN_ID:
-            from handlers.admin import admin_text_handler
-
             await admin_text_handler(update, context)
             return
 
@@ -282,11 +438,9 @@ async def text_message_handler(
                 active_ticket.id,
             )
             await handle_ticket_message(
-                update, context, active_ticket.id, text
+                update, context, active_ticket.id, text, user_lang
             )
         else:
-            from handlers.start import get_user_inline_menu
-
             await message.reply_text(
                 get_text(
                     "messages.please_choose_from_menu", lang=user_lang
@@ -296,11 +450,13 @@ async def text_message_handler(
 
 
 async def handle_question_text(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, text: str
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    text: str,
+    user_lang: str,
 ) -> None:
     """Handle question text from user."""
     user = update.effective_user
-    user_lang = get_user_language(user.id)
 
     if len(text) < ASK_MIN_LENGTH:
         await update.message.reply_text(
@@ -319,51 +475,27 @@ async def handle_question_text(
 
     context.user_data["state"] = None
 
-    await update.message.reply_text(
-        get_text(
-            "messages.ticket_created",
-            lang=user_lang,
-            ticket_id=ticket.id,
+    await asyncio.gather(
+        update.message.reply_text(
+            get_text(
+                "messages.ticket_created",
+                lang=user_lang,
+                ticket_id=ticket.id,
+            ),
+            reply_markup=ReplyKeyboardRemove(),
         ),
-        reply_markup=ReplyKeyboardRemove(),
+        send_or_update_ticket_card(context, ticket.id, action="new"),
     )
 
-    await send_or_update_ticket_card(context, ticket.id, action="new")
-
 
-async def handle_suggestion_text(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, text: str
+async def _send_feedback_to_admin(
+    context: ContextTypes.DEFAULT_TYPE,
+    feedback_id: str,
+    feedback_type: str,
+    user,
+    text: str,
 ) -> None:
-    """Handle suggestion text from user."""
-    user = update.effective_user
-    user_lang = get_user_language(user.id)
-
-    skip_cooldown = context.user_data.get("skip_cooldown", False)
-
-    if not skip_cooldown:
-        can_send, error_msg = feedback_service.check_cooldown(
-            user.id, "suggestion", user_lang
-        )
-        if not can_send:
-            await update.message.reply_text(
-                error_msg, reply_markup=ReplyKeyboardRemove()
-            )
-            return
-
-        feedback_service.update_last_feedback(user.id, "suggestion")
-
-    context.user_data["state"] = None
-    context.user_data["skip_cooldown"] = False
-
-    await update.message.reply_text(
-        get_text("messages.suggestion_sent", lang=user_lang),
-        reply_markup=ReplyKeyboardRemove(),
-    )
-
-    feedback_id = feedback_service.create_feedback(
-        user.id, "suggestion", text
-    )
-
+    """Send suggestion/review to admin with "thank" button."""
     try:
         admin_lang = get_admin_language()
 
@@ -371,45 +503,48 @@ async def handle_suggestion_text(
             [
                 [
                     InlineKeyboardButton(
-                        get_text(
-                            "admin.thank_suggestion", lang=admin_lang
-                        ),
+                        _card_strings(admin_lang)["buttons"][
+                            f"thank_{feedback_type}"
+                        ],
                         callback_data=f"thank:{feedback_id}",
                     )
                 ]
             ]
         )
 
-        suggestion_header = get_text(
-            "admin.suggestion_from", lang=admin_lang
+        header = get_text(
+            f"admin.{feedback_type}_from", lang=admin_lang
         ).format(username=user.username or "unknown", user_id=user.id)
 
-        msg = await context.bot.send_message(
+        msg = await send_queue.submit(
+            "send_message",
             chat_id=ADMIN_ID,
-            text=f"{suggestion_header}:\n\n{text}",
+            text=f"{header}:\n\n{text}",
             reply_markup=keyboard,
         )
 
         feedback_service.set_message_id(feedback_id, msg.message_id)
-        logger.info("Suggestion sent to admin: %s", feedback_id)
+        logger.info("%s sent to admin: %s", feedback_type.capitalize(), feedback_id)
     except Exception as e:
         logger.error(
-            "Failed to send suggestion alert: %s", e, exc_info=True
+            "Failed to send %s alert: %s", feedback_type, e, exc_info=True
         )
 
 
-async def handle_review_text(
-    update: Update, context: ContextTypes.DEFAULT_TYPE, text: str
+async def handle_suggestion_text(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    text: str,
+    user_lang: str,
 ) -> None:
-    """Handle review text from user."""
+    """Handle suggestion text from user."""
     user = update.effective_user
-    user_lang = get_user_language(user.id)
 
     skip_cooldown = context.user_data.get("skip_cooldown", False)
 
     if not skip_cooldown:
         can_send, error_msg = feedback_service.check_cooldown(
-            user.id, "review", user_lang
+            user.id, "suggestion", user_lang
         )
         if not can_send:
             await update.message.reply_text(
@@ -417,48 +552,59 @@ async def handle_review_text(
             )
             return
 
-        feedback_service.update_last_feedback(user.id, "review")
+        feedback_service.update_last_feedback(user.id, "suggestion")
 
     context.user_data["state"] = None
     context.user_data["skip_cooldown"] = False
 
-    await update.message.reply_text(
-        get_text("messages.review_sent", lang=user_lang),
-        reply_markup=ReplyKeyboardRemove(),
+    feedback_id = feedback_service.create_feedback(user.id, "suggestion", text)
+
+    # User confirmation and admin alert don't depend on each other
+    await asyncio.gather(
+        update.message.reply_text(
+            get_text("messages.suggestion_sent", lang=user_lang),
+            reply_markup=ReplyKeyboardRemove(),
+        ),
+        _send_feedback_to_admin(context, feedback_id, "suggestion", user, text),
     )
 
-    feedback_id = feedback_service.create_feedback(user.id, "review", text)
 
-    try:
-        admin_lang = get_admin_language()
+async def handle_review_text(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    text: str,
+    user_lang: str,
+) -> None:
+    """Handle review text from user."""
+    user = update.effective_user
 
-        keyboard = InlineKeyboardMarkup(
-            [
-                [
-                    InlineKeyboardButton(
-                        get_text("admin.thank_review", lang=admin_lang),
-                        callback_data=f"thank:{feedback_id}",
-                    )
-                ]
-            ]
+    skip_cooldown = context.user_data.get("skip_cooldown", False)
+
+    if not skip_cooldown:
+        can_send, error_msg = feedback_service.check_cooldown(
+            user.id, "review", user_lang
         )
+        if not can_send:
+            await update.message.reply_text(
+                error_msg, reply_markup=ReplyKeyboardRemove()
+            )
+            return
 
-        review_header = get_text(
-            "admin.review_from", lang=admin_lang
-        ).format(username=user.username or "unknown", user_id=user.id)
+        feedback_service.update_last_feedback(user.id, "review")
 
-        msg = await context.bot.send_message(
-            chat_id=ADMIN_ID,
-            text=f"{review_header}:\n\n{text}",
-            reply_markup=keyboard,
-        )
+    context.user_data["state"] = None
+    context.user_data["skip_cooldown"] = False
 
-        feedback_service.set_message_id(feedback_id, msg.message_id)
-        logger.info("Review sent to admin: %s", feedback_id)
-    except Exception as e:
-        logger.error(
-            "Failed to send review alert: %s", e, exc_info=True
-        )
+    feedback_id = feedback_service.create_feedback(user.id, "review", text)
+
+    # User confirmation and admin alert don't depend on each other
+    await asyncio.gather(
+        update.message.reply_text(
+            get_text("messages.review_sent", lang=user_lang),
+            reply_markup=ReplyKeyboardRemove(),
+        ),
+        _send_feedback_to_admin(context, feedback_id, "review", user, text),
+    )
 
 
 async def handle_ticket_message(
@@ -466,11 +612,10 @@ async def handle_ticket_message(
     context: ContextTypes.DEFAULT_TYPE,
     ticket_id: str,
     text: str,
+    user_lang: str,
 ) -> None:
     """Handle message in active ticket."""
     user = update.effective_user
-    user_lang = get_user_language(user.id)
-
     ticket_service.add_message(ticket_id, "user", text)
 
     await update.message.reply_text(
@@ -478,34 +623,42 @@ async def handle_ticket_message(
         reply_markup=ReplyKeyboardRemove(),
     )
 
-    admin_lang = get_admin_language()
+    # Admin side runs in background so a slow admin chat doesn't hold up
+    # updates from other users; the notice is sent for every message,
+    # the card refresh is debounced
+    context.application.create_task(
+        _notify_admin_of_message(
+            context,
+            ticket_id,
+            f"👤 @{user.username or 'unknown'} (ID: {user.id}):\n\n{text}",
+        ),
+        update=update,
+    )
+    _schedule_card_refresh(context, ticket_id)
+
 
-    keyboard = InlineKeyboardMarkup(
+def _reply_confirm_keyboard(ticket_id: str, lang: str) -> InlineKeyboardMarkup:
+    """Confirm/edit/cancel keyboard for admin reply preview."""
+    labels = _card_strings(lang)["buttons"]
+    return InlineKeyboardMarkup(
         [
             [
                 InlineKeyboardButton(
-                    get_text("search.button_open", lang=admin_lang),
-                    callback_data=f"ticket:{ticket_id}",
-                )
+                    labels["confirm_reply_yes"],
+                    callback_data=f"reply_confirm:{ticket_id}",
+                ),
+                InlineKeyboardButton(
+                    labels["confirm_reply_edit"],
+                    callback_data=f"reply_edit:{ticket_id}",
+                ),
+                InlineKeyboardButton(
+                    labels["confirm_reply_no"],
+                    callback_data=f"reply_cancel:{ticket_id}",
+                ),
             ]
         ]
     )
 
-    try:
-        await context.bot.send_message(
-            chat_id=ADMIN_ID,
-            text=f"👤 @{user.username or 'unknown'} (ID: {user.id}):\n\n{text}",
-            reply_markup=keyboard,
-        )
-        logger.info("Message sent to admin from user %s", user.id)
-    except Exception as e:
-        logger.error("Failed to send message to admin: %s", e)
-
-    message_id = TICKET_CARD_MESSAGES.get(ticket_id)
-    await send_or_update_ticket_card(
-        context, ticket_id, action="message", message_id=message_id
-    )
-
 
 async def handle_admin_reply(
     update: Update, context: ContextTypes.DEFAULT_TYPE, text: str
@@ -530,31 +683,38 @@ async def handle_admin_reply(
         )
     )
 
-    keyboard = InlineKeyboardMarkup(
-        [
-            [
-                InlineKeyboardButton(
-                    get_text("admin.confirm_reply_yes", lang=admin_lang),
-                    callback_data=f"reply_confirm:{ticket_id}",
-                ),
-                InlineKeyboardButton(
-                get_text("admin.confirm_reply_edit", lang=admin_lang),
-                callback_data=f"reply_edit:{ticket_id}",
-                ),
-                InlineKeyboardButton(
-                    get_text("admin.confirm_reply_no", lang=admin_lang),
-                    callback_data=f"reply_cancel:{ticket_id}",
-                ),
-            ]
-        ]
-    )
-
     await update.message.reply_text(
         preview_text,
-        reply_markup=keyboard,
+        reply_markup=_reply_confirm_keyboard(ticket_id, admin_lang),
     )
 
 
+# Conversation state -> text handler, used by text_message_handler
+_STATE_DISPATCH = {
+    STATE_AWAITING_QUESTION: handle_question_text,
+    STATE_AWAITING_SUGGESTION: handle_suggestion_text,
+    STATE_AWAITING_REVIEW: handle_review_text,
+    # Admin reply preview is shown in admin language, user_lang is not needed
+    STATE_AWAITING_REPLY: lambda update, context, text, user_lang: handle_admin_reply(
+        update, context, text
+    ),
+}
+
+
+# Message attributes checked (in order) to name media type,
+# each has matching "media_types.<attr>" locale key
+MEDIA_ATTRS = (
+    "photo",
+    "video",
+    "document",
+    "audio",
+    "voice",
+    "sticker",
+    "animation",
+    "video_note",
+)
+
+
 async def media_handler(
     update: Update, context: ContextTypes.DEFAULT_TYPE
 ) -> None:
@@ -574,22 +734,10 @@ async def media_handler(
 
     user_lang = get_user_language(user.id)
 
-    if update.message.photo:
-        media_type = get_text("media_types.photo", lang=user_lang)
-    elif update.message.video:
-        media_type = get_text("media_types.video", lang=user_lang)
-    elif update.message.document:
-        media_type = get_text("media_types.document", lang=user_lang)
-    elif update.message.audio:
-        media_type = get_text("media_types.audio", lang=user_lang)
-    elif update.message.voice:
-        media_type = get_text("media_types.voice", lang=user_lang)
-    elif update.message.sticker:
-        media_type = get_text("media_types.sticker", lang=user_lang)
-    elif update.message.animation:
-        media_type = get_text("media_types.animation", lang=user_lang)
-    elif update.message.video_note:
-        media_type = get_text("media_types.video_note", lang=user_lang)
+    for attr in MEDIA_ATTRS:
+        if getattr(update.message, attr):
+            media_type = get_text(f"media_types.{attr}", lang=user_lang)
+            break
     else:
         media_type = get_text("media_types.unknown", lang=user_lang)
 
@@ -608,31 +756,33 @@ async def media_handler(
 
                 admin_lang = get_admin_language()
 
-                await update.message.reply_text(
-                    get_text(
-                        "messages.answer_sent",
-                        lang=admin_lang,
-                        ticket_id=ticket_id,
+                # Confirmation, forward and card refresh are independent
+                confirmed, forwarded, _ = await asyncio.gather(
+                    update.message.reply_text(
+                        get_text(
+                            "messages.answer_sent",
+                            lang=admin_lang,
+                            ticket_id=ticket_id,
+                        ),
+                        reply_markup=ReplyKeyboardRemove(),
                     ),
-                    reply_markup=ReplyKeyboardRemove(),
+                    update.message.forward(chat_id=ticket.user_id),
+                    send_or_update_ticket_card(
+                        context,
+                        ticket_id,
+                        action="working",
+                        message_id=ticket_card_store.get(ticket_id),
+                    ),
+                    return_exceptions=True,
                 )
-
-                try:
-                    await update.message.forward(chat_id=ticket.user_id)
-                except Exception as e:
+                if isinstance(forwarded, Exception):
                     logger.error(
                         "Failed to forward media to user %s: %s",
                         ticket.user_id,
-                        e,
+                        forwarded,
                     )
-
-                message_id = TICKET_CARD_MESSAGES.get(ticket_id)
-                await send_or_update_ticket_card(
-                    context,
-                    ticket_id,
-                    action="working",
-                    message_id=message_id,
-                )
+                if isinstance(confirmed, Exception):
+                    raise confirmed
         return
 
     active_ticket = ticket_service.get_user_active_ticket(user.id)
@@ -655,40 +805,15 @@ async def media_handler(
             reply_markup=ReplyKeyboardRemove(),
         )
 
-        admin_lang = get_admin_language()
-
-        keyboard = InlineKeyboardMarkup(
-            [
-                [
-                    InlineKeyboardButton(
-                        f"📋 {get_text('search.button_open', lang=admin_lang)}",
-                        callback_data=f"ticket:{active_ticket.id}",
-                    )
-                ]
-            ]
-        )
-
-        try:
-            await context.bot.send_message(
-                chat_id=ADMIN_ID,
-                text=f"👤 @{user.username or 'unknown'} (ID: {user.id}):\n[{media_type}]",
-                reply_markup=keyboard,
-            )
-            logger.info(
-                "Media notification sent to admin from user %s", user.id
-            )
-        except Exception as e:
-            logger.error(
-                "Failed to send media notification to admin: %s", e
-            )
-
-        message_id = TICKET_CARD_MESSAGES.get(active_ticket.id)
-        await send_or_update_ticket_card(
-            context,
-            active_ticket.id,
-            action="message",
-            message_id=message_id,
+        context.application.create_task(
+            _notify_admin_of_message(
+                context,
+                active_ticket.id,
+                f"👤 @{user.username or 'unknown'} (ID: {user.id}):\n[{media_type}]",
+            ),
+            update=update,
         )
+        _schedule_card_refresh(context, active_ticket.id)
 
 
 async def back_to_service_handler(
@@ -11,6 +11,11 @@ _current_locale = None
 _locales_data: Dict[str, Dict[str, Any]] = {}
 # Dictionary to store user-specific locale preferences: {user_id: locale_code}
 _user_locales: Dict[int, str] = {}
+# Flattened locale data: {locale_code: {"messages.welcome": value}},
+# filled by load_locales() so lookups are a single dict access
+_locales_flat: Dict[str, Dict[str, Any]] = {}
+# Keys whose translation contains HTML markup in any locale: {key: bool}
+_HAS_HTML: Dict[str, bool] = {}
 
 
 def load_locales():
@@ -33,6 +38,48 @@ def load_locales():
         except json.JSONDecodeError as e:
             logger.error(f"❌ Error parsing {locale_file}: {e}")
 
+    _HAS_HTML.clear()
+    for data in _locales_data.values():
+        _scan_html(data, "")
+
+    _locales_flat.clear()
+    for locale_code, data in _locales_data.items():
+        flat: Dict[str, Any] = {}
+        _flatten(data, "", flat)
+        _locales_flat[locale_code] = flat
+
+
+def _flatten(node: Dict[str, Any], prefix: str, out: Dict[str, Any]):
+    """Map every dot-separated key (leaves and sections) to its value"""
+    for k, v in node.items():
+        key = f"{prefix}{k}"
+        out[key] = v
+        if isinstance(v, dict):
+            _flatten(v, f"{key}.", out)
+
+
+def _scan_html(node: Dict[str, Any], prefix: str):
+    """Record which translation keys contain HTML tags or entities"""
+    for k, v in node.items():
+        key = f"{prefix}{k}"
+        if isinstance(v, dict):
+            _scan_html(v, f"{key}.")
+        elif isinstance(v, str):
+            _HAS_HTML[key] = _HAS_HTML.get(key, False) or "<" in v or "&" in v
+
+
+def has_html(key: str) -> bool:
+    """
+    Check whether translation needs parse_mode='HTML'
+
+    Args:
+        key: Dot-separated translation key
+
+    Returns:
+        True if any locale uses HTML markup for this key
+    """
+    return _HAS_HTML.get(key, False)
+
 
 def set_locale(locale_code: str) -> bool:
     """
@@ -173,19 +220,17 @@ def get_text(key: str, lang: Optional[str] = None, locale: Optional[str] = None,
             logger.error(f"❌ No locale set (key: {key})")
             return ""
 
-        # Navigate through nested dictionary using dot notation
-        # e.g., "messages.welcome" -> _locales_data[locale]["messages"]["welcome"]
-        keys = key.split(".")
-        value = _locales_data[current_locale]
-
-        for k in keys:
-            value = value[k]
+        # Dot-separated keys are pre-flattened at load time
+        # e.g., "messages.welcome" -> _locales_flat[locale]["messages.welcome"]
+        value = _locales_flat[current_locale][key]
 
-        # Format string with provided parameters
-        if kwargs:
+        # Format string with provided parameters; plain texts (most button
+        # labels) have no placeholders, so skip the format pass entirely
+        if kwargs and "{" in value:
             try:
-                # Use ALL parameters for formatting (user_id can be used in format strings)
-                return value.format(**kwargs)
+                # Use ALL parameters for formatting (user_id can be used in format strings);
+                # format_map takes kwargs as-is instead of unpacking into a new dict
+                return value.format_map(kwargs)
             except KeyError as format_error:
                 logger.warning(f"⚠️ Format parameter missing in key '{key}': {format_error}")
                 # Return unformatted value instead of empty string
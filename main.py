@@ -14,7 +14,7 @@ from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQu
 
 # Import configuration first
 from config import (
-    TOKEN, ADMIN_ID,
+    TOKEN, ADMIN_ID, CONNECTION_POOL_SIZE,
     post_init, post_shutdown,
     BOT_NAME, BOT_VERSION, BOT_BUILD_DATE
 )
@@ -29,7 +29,6 @@ from handlers.admin import (
     home_handler
 )
 from handlers.commands import (
-    admin_command,
     backup_command,
     test_error_command,  # NEW: import test_error_command
 )
@@ -46,18 +45,25 @@ def main():
     application = (
         Application.builder()
         .token(TOKEN)
+        # Bursts of /start and notifications need many in-flight requests
+        .connection_pool_size(CONNECTION_POOL_SIZE)
         .post_init(post_init)
         .post_shutdown(post_shutdown)
         .build()
     )
 
+    # Admin-only commands are filtered by PTB before the callback is scheduled
+    admin_only = filters.User(user_id=ADMIN_ID)
+
     # Add command handlers
     application.add_handler(CommandHandler("start", start_handler))
-    application.add_handler(CommandHandler("admin", admin_command))
-    application.add_handler(CommandHandler("backup", backup_command))
+    application.add_handler(CommandHandler("admin", home_handler, filters=admin_only))
+    application.add_handler(CommandHandler("backup", backup_command, filters=admin_only))
 
     # NEW: test command to trigger an intentional error (for error-handler verification)
-    application.add_handler(CommandHandler("test_error", test_error_command))
+    application.add_handler(
+        CommandHandler("test_error", test_error_command, filters=admin_only)
+    )
 
     # Add callback handler
     application.add_handler(CallbackQueryHandler(callback_handler))
@@ -3,11 +3,13 @@ from .bans import ban_manager
 from .feedback import feedback_service
 from .alerts import alert_service
 from .backup import backup_service
+from .send_queue import send_queue
 
 __all__ = [
     'ticket_service',
     'ban_manager',
     'feedback_service',
     'alert_service',
-    'backup_service'
+    'backup_service',
+    'send_queue'
 ]
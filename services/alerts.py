@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
+import asyncio
 import logging
 import os
+from pathlib import Path
 from typing import Optional
 
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
@@ -21,7 +23,7 @@ from config import (
     BACKUP_DIR,
 )
 from storage.data_manager import data_manager
-from locales import _, set_locale
+from locales import _
 from utils.locale_helper import get_admin_language, get_user_language
 
 logger = logging.getLogger(__name__)
@@ -45,15 +47,13 @@ class AlertService:
 
     # ---------- locale helpers ----------
 
-    def _load_admin_locale(self) -> None:
-        """Set global locale to admin's preferred language."""
+    def _admin_lang(self) -> str:
+        """Admin's preferred language for alert texts."""
         try:
-            user_data = data_manager.get_user_data(ADMIN_ID)
-            admin_locale = user_data.get("locale", "ru")
-            set_locale(admin_locale)
+            return get_admin_language()
         except Exception as e:
             logger.warning("Failed to load admin locale, using default: %s", e)
-            set_locale("ru")
+            return "ru"
 
     # ---------- low-level send wrappers ----------
 
@@ -121,19 +121,22 @@ class AlertService:
                 size_mb,
             )
 
-            with open(backup_path, "rb") as f:
-                kwargs = {
-                    "chat_id": chat_id,
-                    "document": f,
-                    "caption": caption,
-                    "filename": os.path.basename(backup_path),
-                    # caption без parse_mode, чтобы не ломать < >
-                    "parse_mode": None,
-                }
-                if ALERT_TOPIC_ID:
-                    kwargs["message_thread_id"] = ALERT_TOPIC_ID
+            # PTB reads file objects synchronously; load the archive in a
+            # worker thread so the event loop is not blocked on disk I/O
+            document = await asyncio.to_thread(Path(backup_path).read_bytes)
 
-                await self._bot.send_document(**kwargs)
+            kwargs = {
+                "chat_id": chat_id,
+                "document": document,
+                "caption": caption,
+                "filename": os.path.basename(backup_path),
+                # caption без parse_mode, чтобы не ломать < >
+                "parse_mode": None,
+            }
+            if ALERT_TOPIC_ID:
+                kwargs["message_thread_id"] = ALERT_TOPIC_ID
+
+            await self._bot.send_document(**kwargs)
 
             logger.info(
                 "Backup file sent to Telegram: %s",
@@ -260,7 +263,7 @@ class AlertService:
 
         from datetime import datetime
 
-        self._load_admin_locale()
+        lang = self._admin_lang()
 
         now = datetime.now(TIMEZONE).strftime("%d.%m.%Y %H:%M:%S")
         stats = data_manager.get_stats()
@@ -289,15 +292,15 @@ class AlertService:
 
         # Детали: время, файлы, статистика
         details = (
-            f"\n{_('alerts.time', time=now)}\n\n"
-            f"{_('alerts.files')}\n"
-            f"{_('alerts.file_data', status=check_path(data_json))}\n"
-            f"{_('alerts.file_log', status=check_path(log_file))}\n"
-            f"{_('alerts.file_backups', status=check_path(BACKUP_DIR))}\n\n"
-            f"{_('alerts.stats')}\n"
-            f"{_('alerts.stat_active', count=stats['active_tickets'])}\n"
-            f"{_('alerts.stat_total', count=stats['total_tickets'])}\n"
-            f"{_('alerts.stat_users', count=stats['total_users'])}"
+            f"\n{_('alerts.time', lang=lang, time=now)}\n\n"
+            f"{_('alerts.files', lang=lang)}\n"
+            f"{_('alerts.file_data', lang=lang, status=check_path(data_json))}\n"
+            f"{_('alerts.file_log', lang=lang, status=check_path(log_file))}\n"
+            f"{_('alerts.file_backups', lang=lang, status=check_path(BACKUP_DIR))}\n\n"
+            f"{_('alerts.stats', lang=lang)}\n"
+            f"{_('alerts.stat_active', lang=lang, count=stats['active_tickets'])}\n"
+            f"{_('alerts.stat_total', lang=lang, count=stats['total_tickets'])}\n"
+            f"{_('alerts.stat_users', lang=lang, count=stats['total_users'])}"
         )
 
         text = startup_summary + details
@@ -319,35 +322,35 @@ class AlertService:
 
         from datetime import datetime
 
-        self._load_admin_locale()
+        lang = self._admin_lang()
 
         now = datetime.now(TIMEZONE).strftime("%d.%m.%Y %H:%M:%S")
         stats = data_manager.get_stats()
 
         text = (
-            f"{_('alerts.bot_stopped')}\n"
+            f"{_('alerts.bot_stopped', lang=lang)}\n"
             f"🤖 Bot: {BOT_NAME}\n"
             f"🔖 Version: {BOT_VERSION}\n"
             f"📅 Build: {BOT_BUILD_DATE}\n\n"
-            f"{_('alerts.time', time=now)}\n\n"
-            f"{_('alerts.stats')}\n"
-            f"{_('alerts.stat_active', count=stats['active_tickets'])}\n"
-            f"{_('alerts.stat_total', count=stats['total_tickets'])}\n"
-            f"{_('alerts.stat_users', count=stats['total_users'])}"
+            f"{_('alerts.time', lang=lang, time=now)}\n\n"
+            f"{_('alerts.stats', lang=lang)}\n"
+            f"{_('alerts.stat_active', lang=lang, count=stats['active_tickets'])}\n"
+            f"{_('alerts.stat_total', lang=lang, count=stats['total_tickets'])}\n"
+            f"{_('alerts.stat_users', lang=lang, count=stats['total_users'])}"
         )
 
         await self.send_alert(text)
 
     async def send_backup_alert(self, backup_info: str) -> None:
         """Backup creation notification."""
-        self._load_admin_locale()
-        await self.send_alert(_("alerts.backup_created", info=backup_info))
+        lang = self._admin_lang()
+        await self.send_alert(_("alerts.backup_created", lang=lang, info=backup_info))
 
     async def send_ticket_auto_closed_alert(self, ticket_id: str, hours: int) -> None:
         """Auto-closed ticket notification (simple text alert)."""
-        self._load_admin_locale()
+        lang = self._admin_lang()
         await self.send_alert(
-            _("alerts.ticket_auto_closed", ticket_id=ticket_id, hours=hours)
+            _("alerts.ticket_auto_closed", lang=lang, ticket_id=ticket_id, hours=hours)
         )
 
 
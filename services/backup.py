@@ -3,7 +3,7 @@ import shutil
 import logging
 import tarfile
 from datetime import datetime, timedelta
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
 from config import (
     BACKUP_DIR, DATA_DIR, DATA_FILE, BANNED_FILE,
     BACKUP_RETENTION_DAYS, BACKUP_FILE_PREFIX,
@@ -17,12 +17,18 @@ from config import (
 logger = logging.getLogger(__name__)
 
 class BackupService:
-    def create_backup(self, backup_type: str = "manual") -> Tuple[str, dict]:
+    def create_backup(
+        self,
+        backup_type: str = "manual",
+        progress_cb: Optional[Callable[[int], None]] = None,
+    ) -> Tuple[str, dict]:
         """
         Create backup. Returns tuple (backup_path, backup_info)
 
         Args:
             backup_type: Type of backup - 'startup', 'shutdown', 'scheduled', 'manual'
+            progress_cb: Optional callback receiving number of files added so far.
+                Called from the thread running the backup.
         """
         if not BACKUP_ENABLED:
             logger.info("Backup is disabled by config")
@@ -33,9 +39,9 @@ class BackupService:
             backup_name = f"{BACKUP_FILE_PREFIX}{timestamp}"
 
             if BACKUP_FULL_PROJECT:
-                backup_path, backup_info = self._create_full_backup(backup_name)
+                backup_path, backup_info = self._create_full_backup(backup_name, progress_cb)
             else:
-                backup_path, backup_info = self._create_files_backup(backup_name)
+                backup_path, backup_info = self._create_files_backup(backup_name, progress_cb)
 
             # Add backup_type to info
             backup_info['backup_type'] = backup_type
@@ -80,7 +86,9 @@ class BackupService:
         else:
             return f"{size_bytes / (1024 * 1024 * 1024):.2f}GB"
 
-    def _create_full_backup(self, backup_name: str) -> Tuple[str, dict]:
+    def _create_full_backup(
+        self, backup_name: str, progress_cb: Optional[Callable[[int], None]] = None
+    ) -> Tuple[str, dict]:
         """Create full project backup"""
         backup_path = os.path.join(BACKUP_DIR, f"{backup_name}.tar.gz")
         project_root = os.path.abspath(BACKUP_SOURCE_DIR)
@@ -110,6 +118,8 @@ class BackupService:
 
             logger.debug(f"INCLUDING: {tarinfo.name}")
             included_count += 1
+            if progress_cb:
+                progress_cb(included_count)
             return tarinfo
 
         with tarfile.open(backup_path, "w:gz") as tar:
@@ -138,7 +148,9 @@ class BackupService:
 
         return backup_path, backup_info
 
-    def _create_files_backup(self, backup_name: str) -> Tuple[str, dict]:
+    def _create_files_backup(
+        self, backup_name: str, progress_cb: Optional[Callable[[int], None]] = None
+    ) -> Tuple[str, dict]:
         """Create backup of selected files"""
         backup_path = os.path.join(BACKUP_DIR, f"{backup_name}.tar.gz")
 
@@ -152,6 +164,8 @@ class BackupService:
                     tar.add(file_path, arcname=filename)
                     files_added += 1
                     logger.debug(f"Added to backup: {filename}")
+                    if progress_cb:
+                        progress_cb(files_added)
                 else:
                     logger.warning(f"File {file_path} not found and skipped")
 
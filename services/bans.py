@@ -117,6 +117,10 @@ class BanManager:
         """Get list of banned users as (user_id, reason)."""
         return list(self.banned.items())
 
+    def get_banned_count(self) -> int:
+        """Get number of banned users."""
+        return len(self.banned)
+
     def check_name_for_link(self, name: str) -> bool:
         """
         Check display name for links according to NAME_LINK_PATTERN.
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Outgoing message queue
+
+Bot API sends go through a bounded asyncio.Queue drained by a small pool of
+background workers. Workers pace calls with a shared token bucket so bursts
+of notifications stay under Telegram's global flood limit (~30 msg/s).
+Handlers either post() a call and return immediately, or submit() it and
+await the result when they need it (e.g. a message_id). Edits of the same
+message that are still queued are coalesced: only the latest text is sent.
+Flood-control responses (429 RetryAfter) pause all sends and retry.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from telegram import Bot
+from telegram.error import RetryAfter
+
+logger = logging.getLogger(__name__)
+
+# Bot methods that modify an existing message and can be coalesced
+EDIT_METHODS = frozenset(
+    {"edit_message_text", "edit_message_reply_markup", "edit_message_caption"}
+)
+
+
+@dataclass
+class PendingSend:
+    """Single Bot API call waiting in the queue."""
+
+    method: str
+    kwargs: dict[str, Any]
+    # None for fire-and-forget calls: failures are only logged
+    future: Optional[asyncio.Future] = None
+    key: Optional[tuple] = None
+
+
+class SendQueue:
+    """Bounded, rate-limited queue for Bot API calls."""
+
+    def __init__(
+        self,
+        rate_per_sec: float = 30.0,
+        burst: int = 30,
+        max_size: int = 500,
+        workers: int = 4,
+        max_retries: int = 3,
+    ) -> None:
+        self._bot: Optional[Bot] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: list[asyncio.Task] = []
+        # {(method, chat_id, message_id): PendingSend} for edits not yet sent
+        self._pending_edits: dict[tuple, PendingSend] = {}
+        self.rate = rate_per_sec
+        self.burst = burst
+        self.max_size = max_size
+        self.worker_count = workers
+        self.max_retries = max_retries
+        self._tokens = float(burst)
+        self._updated = 0.0
+        # Loop time until which sends are paused after RetryAfter
+        self._blocked_until = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._queue is not None
+
+    def set_bot(self, bot: Bot) -> None:
+        """Set bot used for sending."""
+        self._bot = bot
+
+    async def start(self) -> None:
+        """Create the queue and start worker tasks."""
+        if self.running:
+            logger.warning("Send queue already running")
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._updated = asyncio.get_running_loop().time()
+        self._tokens = float(self.burst)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"send_queue_worker_{i}")
+            for i in range(self.worker_count)
+        ]
+        logger.info(
+            "Send queue started (%s workers, max %s queued)",
+            self.worker_count,
+            self.max_size,
+        )
+
+    async def stop(self) -> None:
+        """Stop workers; calls still queued are dropped."""
+        if not self.running:
+            return
+        queue, self._queue = self._queue, None
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if not queue.empty():
+            logger.warning(
+                "Send queue stopped, dropped %s queued calls", queue.qsize()
+            )
+        while not queue.empty():
+            item = queue.get_nowait()
+            if item.future is not None and not item.future.done():
+                item.future.cancel()
+        self._pending_edits.clear()
+        logger.info("Send queue stopped")
+
+    def post(self, method: str, **kwargs) -> bool:
+        """
+        Queue Bot API call without waiting for it.
+
+        Args:
+            method: Bot method name (send_message, edit_message_text, ...)
+            **kwargs: Arguments for the Bot method
+
+        Returns:
+            True if the call was queued (or merged into a queued edit),
+            False if it was dropped because the queue is full or stopped
+        """
+        if not self.running:
+            logger.warning("Send queue not running, dropped %s", method)
+            return False
+        if self._coalesce(method, kwargs) is not None:
+            return True
+        item = self._make_item(method, kwargs)
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            logger.warning(
+                "Send queue full (%s), dropped %s to chat %s",
+                self.max_size,
+                method,
+                kwargs.get("chat_id"),
+            )
+            return False
+        self._track(item)
+        return True
+
+    async def submit(self, method: str, **kwargs) -> Any:
+        """
+        Queue Bot API call and wait for its result.
+
+        Waits for free space when the queue is full.
+
+        Args:
+            method: Bot method name (send_message, edit_message_text, ...)
+            **kwargs: Arguments for the Bot method
+
+        Returns:
+            Whatever the Bot method returns; coalesced edits share the
+            result of the single call that was actually made
+        """
+        if self._bot is None:
+            raise RuntimeError("Send queue bot not configured")
+
+        # Not running (startup/shutdown): call the API directly
+        if not self.running:
+            return await getattr(self._bot, method)(**kwargs)
+
+        pending = self._coalesce(method, kwargs)
+        if pending is not None:
+            if pending.future is None:
+                pending.future = asyncio.get_running_loop().create_future()
+            return await asyncio.shield(pending.future)
+
+        item = self._make_item(method, kwargs)
+        item.future = asyncio.get_running_loop().create_future()
+        await self._queue.put(item)
+        self._track(item)
+        return await asyncio.shield(item.future)
+
+    @staticmethod
+    def _make_item(method: str, kwargs: dict[str, Any]) -> PendingSend:
+        key = None
+        if method in EDIT_METHODS:
+            key = (method, kwargs.get("chat_id"), kwargs.get("message_id"))
+        return PendingSend(method, kwargs, key=key)
+
+    def _coalesce(self, method: str, kwargs: dict[str, Any]) -> Optional[PendingSend]:
+        """Replace kwargs of a queued edit of the same message, if any."""
+        if method not in EDIT_METHODS:
+            return None
+        key = (method, kwargs.get("chat_id"), kwargs.get("message_id"))
+        pending = self._pending_edits.get(key)
+        if pending is not None:
+            pending.kwargs = kwargs
+        return pending
+
+    def _track(self, item: PendingSend) -> None:
+        if item.key is not None:
+            self._pending_edits[item.key] = item
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        while True:
+            item = await queue.get()
+            try:
+                try:
+                    await self._acquire()
+                finally:
+                    # From here on the call is in flight and can't be merged
+                    if item.key is not None and self._pending_edits.get(item.key) is item:
+                        del self._pending_edits[item.key]
+                await self._send(item)
+            except asyncio.CancelledError:
+                if item.future is not None and not item.future.done():
+                    item.future.cancel()
+                raise
+            except Exception as e:
+                self._fail(item, e)
+            finally:
+                queue.task_done()
+
+    async def _acquire(self) -> None:
+        """Wait for a send token (reservation-based token bucket)."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        # Reserve a token right away; a negative balance is the wait time
+        self._tokens -= 1
+        delay = max(-self._tokens / self.rate, self._blocked_until - now)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _fail(self, item: PendingSend, error: Exception) -> None:
+        if item.future is None:
+            logger.error(
+                "Failed to %s to chat %s: %s",
+                item.method,
+                item.kwargs.get("chat_id"),
+                error,
+            )
+        elif not item.future.done():
+            item.future.set_exception(error)
+
+    async def _send(self, item: PendingSend) -> None:
+        attempt = 0
+        while True:
+            try:
+                result = await getattr(self._bot, item.method)(**item.kwargs)
+                break
+            except RetryAfter as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    self._fail(item, e)
+                    return
+                # Flood control is bot-wide: pause all sends
+                logger.warning(
+                    "Flood control on %s, retrying in %ss (attempt %s/%s)",
+                    item.method,
+                    e.retry_after,
+                    attempt,
+                    self.max_retries,
+                )
+                loop = asyncio.get_running_loop()
+                self._blocked_until = max(
+                    self._blocked_until, loop.time() + e.retry_after
+                )
+                await self._acquire()
+            except Exception as e:
+                self._fail(item, e)
+                return
+        if item.future is not None and not item.future.done():
+            item.future.set_result(result)
+
+
+send_queue = SendQueue()
@@ -154,11 +154,7 @@ class TicketService:
 
     def get_user_active_ticket(self, user_id: int) -> Optional[Ticket]:
         """Get user's most recent active ticket (new or working status)."""
-        tickets = [
-            t
-            for t in data_manager.get_all_tickets()
-            if t.user_id == user_id and t.status in ["new", "working"]
-        ]
+        tickets = data_manager.get_user_active_tickets(user_id)
 
         if not tickets:
             return None
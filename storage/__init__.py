@@ -1,4 +1,5 @@
 from .data_manager import data_manager
 from .models import Ticket, Message
+from .ticket_cards import ticket_card_store
 
-__all__ = ['data_manager', 'Ticket', 'Message']
+__all__ = ['data_manager', 'Ticket', 'Message', 'ticket_card_store']
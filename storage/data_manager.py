@@ -9,6 +9,9 @@ from config import DATA_FILE, TIMEZONE
 
 logger = logging.getLogger(__name__)
 
+# Ticket statuses that count as "active"
+ACTIVE_STATUSES = frozenset({"new", "working"})
+
 
 class DataManager:
     def __init__(self) -> None:
@@ -19,6 +22,8 @@ class DataManager:
             "feedbacks": {},           # feedback_id -> dict
             "feedback_cooldowns": {},  # user_id(str) -> {feedback_type: iso_datetime_str}
         }
+        # user_id -> ids of user's active tickets
+        self._active_by_user: Dict[int, set] = {}
         self.load()
 
     # ---------- low-level IO helpers ----------
@@ -85,6 +90,12 @@ class DataManager:
 
     def load(self) -> None:
         """Load data from DATA_FILE, fallback to .bak on error."""
+        try:
+            self._load()
+        finally:
+            self._rebuild_active_index()
+
+    def _load(self) -> None:
         raw = self._load_from_path(DATA_FILE)
 
         if raw is None:
@@ -151,6 +162,28 @@ class DataManager:
         except Exception as e:
             logger.error("Error saving data: %s", e, exc_info=True)
 
+    # ---------- active tickets index ----------
+
+    def _rebuild_active_index(self) -> None:
+        """Rebuild user_id -> active ticket ids index from tickets."""
+        self._active_by_user = {}
+        for ticket in self.data["tickets"].values():
+            self._index_ticket(ticket)
+
+    def _index_ticket(self, ticket: Ticket) -> None:
+        """Add/remove ticket in active index according to its status."""
+        if ticket.status in ACTIVE_STATUSES:
+            self._active_by_user.setdefault(ticket.user_id, set()).add(ticket.id)
+        else:
+            self._unindex_ticket(ticket.user_id, ticket.id)
+
+    def _unindex_ticket(self, user_id: int, ticket_id: str) -> None:
+        ids = self._active_by_user.get(user_id)
+        if ids is not None:
+            ids.discard(ticket_id)
+            if not ids:
+                del self._active_by_user[user_id]
+
     # ---------- tickets API ----------
 
     def get_ticket(self, ticket_id: str) -> Optional[Ticket]:
@@ -160,12 +193,14 @@ class DataManager:
     def create_ticket(self, ticket: Ticket) -> None:
         """Create new ticket."""
         self.data["tickets"][ticket.id] = ticket
+        self._index_ticket(ticket)
         self.save()
 
     def update_ticket(self, ticket: Ticket) -> None:
         """Update existing ticket."""
         if ticket.id in self.data["tickets"]:
             self.data["tickets"][ticket.id] = ticket
+            self._index_ticket(ticket)
             self.save()
         else:
             logger.warning("Attempted to update non-existing ticket %s", ticket.id)
@@ -173,7 +208,8 @@ class DataManager:
     def delete_ticket(self, ticket_id: str) -> None:
         """Delete ticket."""
         if ticket_id in self.data["tickets"]:
-            del self.data["tickets"][ticket_id]
+            ticket = self.data["tickets"].pop(ticket_id)
+            self._unindex_ticket(ticket.user_id, ticket_id)
             self.save()
         else:
             logger.warning("Attempted to delete non-existing ticket %s", ticket_id)
@@ -182,6 +218,15 @@ class DataManager:
         """Get all tickets."""
         return list(self.data["tickets"].values())
 
+    def get_user_active_tickets(self, user_id: int) -> List[Ticket]:
+        """Get user's active (new or working) tickets."""
+        tickets = self.data["tickets"]
+        return [
+            tickets[tid]
+            for tid in self._active_by_user.get(user_id, ())
+            if tid in tickets
+        ]
+
     def get_tickets_by_status(self, status: str) -> List[Ticket]:
         """Get tickets by status."""
         return [t for t in self.data["tickets"].values() if t.status == status]
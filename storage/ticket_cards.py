@@ -0,0 +1,60 @@
+"""
+Storage for admin ticket card message IDs
+
+Maps ticket_id -> message_id of the card shown in the admin chat so the
+card can be edited in place instead of being re-sent on every update,
+plus a signature of the last rendered content so no-op edits are skipped.
+Bounded LRU: the least recently used cards are forgotten once the cap
+is reached (a forgotten card is simply re-sent on next update)
+"""
+
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+# Max number of ticket cards remembered
+MAX_TICKET_CARDS = 2048
+
+
+class TicketCardStore:
+    """In-memory ticket_id -> admin card message_id LRU mapping."""
+
+    def __init__(self, max_size: int = MAX_TICKET_CARDS) -> None:
+        # {ticket_id: (message_id, signature of last rendered content)}
+        self._cards: "OrderedDict[str, tuple[int, Optional[Hashable]]]" = OrderedDict()
+        self.max_size = max_size
+
+    def get(self, ticket_id: str) -> Optional[int]:
+        """Get card message ID for ticket, or None if no card is known."""
+        card = self._cards.get(ticket_id)
+        if card is None:
+            return None
+        self._cards.move_to_end(ticket_id)
+        return card[0]
+
+    def get_signature(self, ticket_id: str) -> Optional[Hashable]:
+        """Get signature of content last shown on ticket card."""
+        card = self._cards.get(ticket_id)
+        return card[1] if card is not None else None
+
+    def set(
+        self,
+        ticket_id: str,
+        message_id: int,
+        signature: Optional[Hashable] = None,
+    ) -> None:
+        """Remember card message ID (and content signature) for ticket."""
+        self._cards[ticket_id] = (message_id, signature)
+        self._cards.move_to_end(ticket_id)
+        while len(self._cards) > self.max_size:
+            self._cards.popitem(last=False)
+
+    def pop(self, ticket_id: str) -> Optional[int]:
+        """Forget card for ticket; returns the removed message ID."""
+        card = self._cards.pop(ticket_id, None)
+        return card[0] if card is not None else None
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+
+ticket_card_store = TicketCardStore()
@@ -2,7 +2,10 @@ import logging
 from telegram import Update
 from telegram.ext import ContextTypes
 from config import ADMIN_ID
+from locales import get_text
 from storage.instruction_store import ADMIN_SCREEN_MESSAGES
+from utils.keyboards import get_settings_keyboard, get_language_keyboard
+from utils.locale_helper import get_admin_language
 
 logger = logging.getLogger(__name__)
 
@@ -33,11 +36,11 @@ async def show_admin_screen(update, context, text, keyboard, screen_type="defaul
     # If this is callback (button pressed) - use the SAME message
     if update.callback_query and update.callback_query.message:
         current_msg_id = update.callback_query.message.message_id
-        logger.info(f"🔍 Got message_id from callback: {current_msg_id}")
+        logger.info("🔍 Got message_id from callback: %s", current_msg_id)
     else:
         # If first time from show_inbox/show_ticket - get from storage
         current_msg_id = ADMIN_SCREEN_MESSAGES.get(screen_type)
-        logger.info(f"🔍 Got message_id from storage ({screen_type}): {current_msg_id}")
+        logger.info("🔍 Got message_id from storage (%s): %s", screen_type, current_msg_id)
 
     if current_msg_id:
         try:
@@ -49,7 +52,7 @@ async def show_admin_screen(update, context, text, keyboard, screen_type="defaul
                 reply_markup=keyboard,
                 parse_mode='HTML'
             )
-            logger.info(f"✅ Updated same message: {current_msg_id}")
+            logger.info("✅ Updated same message: %s", current_msg_id)
             ADMIN_SCREEN_MESSAGES[screen_type] = current_msg_id
             return current_msg_id
 
@@ -58,12 +61,12 @@ async def show_admin_screen(update, context, text, keyboard, screen_type="defaul
 
             # If message content hasn't changed
             if "Message is not modified" in error_msg:
-                logger.debug(f"ℹ️ Message not modified (same content)")
+                logger.debug("ℹ️ Message not modified (same content)")
                 ADMIN_SCREEN_MESSAGES[screen_type] = current_msg_id
                 return current_msg_id
 
             # For other errors - create new message
-            logger.debug(f"⚠️ Will create new message: {e}")
+            logger.debug("⚠️ Will create new message: %s", e)
 
     # Create new message only on FIRST call
     try:
@@ -74,14 +77,60 @@ async def show_admin_screen(update, context, text, keyboard, screen_type="defaul
             parse_mode='HTML'
         )
         ADMIN_SCREEN_MESSAGES[screen_type] = msg.message_id
-        logger.info(f"✅ Created first message ({screen_type}): message_id={msg.message_id}")
+        logger.info("✅ Created first message (%s): message_id=%s", screen_type, msg.message_id)
         return msg.message_id
 
     except Exception as e:
-        logger.error(f"❌ Failed to send admin screen ({screen_type}): {e}")
+        logger.error("❌ Failed to send admin screen (%s): %s", screen_type, e)
         return None
 
 
+# Keyboard builders addressable by name from render_admin_screen()
+_ADMIN_KEYBOARDS = {
+    "settings": get_settings_keyboard,
+    "language": get_language_keyboard,
+}
+
+
+async def render_admin_screen(
+    update,
+    context,
+    text_key,
+    keyboard_name=None,
+    *,
+    screen_type="default",
+    lang=None,
+    **fmt,
+):
+    """
+    Render a localized admin screen in one call
+
+    Resolves admin language, text and keyboard, then delegates to show_admin_screen
+
+    Args:
+        update: Telegram update object
+        context: Telegram context object
+        text_key: Locale key of the screen text
+        keyboard_name: Name of keyboard in _ADMIN_KEYBOARDS or None
+        screen_type: Screen type identifier (home, inbox, stats, etc.)
+        lang: Language override (defaults to admin language)
+        **fmt: Format arguments for the screen text
+
+    Returns:
+        Message ID of updated/created message
+    """
+    lang = lang or get_admin_language()
+    keyboard = _ADMIN_KEYBOARDS[keyboard_name](lang) if keyboard_name else None
+
+    return await show_admin_screen(
+        update,
+        context,
+        get_text(text_key, lang=lang, **fmt),
+        keyboard,
+        screen_type=screen_type,
+    )
+
+
 async def reset_admin_screen(context, screen_type: str):
     """
     Reset screen message ID when leaving that screen
@@ -94,7 +143,7 @@ async def reset_admin_screen(context, screen_type: str):
     """
     if screen_type in ADMIN_SCREEN_MESSAGES:
         ADMIN_SCREEN_MESSAGES[screen_type] = None
-        logger.info(f"🔄 Reset {screen_type} screen message ID")
+        logger.info("🔄 Reset %s screen message ID", screen_type)
 
 
 async def clear_all_admin_screens(context):
@@ -111,7 +160,7 @@ async def clear_all_admin_screens(context):
     """
     for key in ADMIN_SCREEN_MESSAGES:
         ADMIN_SCREEN_MESSAGES[key] = None
-    logger.info(f"🗑 Cleared all admin screen message IDs")
+    logger.info("🗑 Cleared all admin screen message IDs")
 
 
 async def get_current_screen_message_id(screen_type: str) -> int:
@@ -136,4 +185,4 @@ async def update_screen_message_id(screen_type: str, message_id: int):
         message_id: New message ID to store
     """
     ADMIN_SCREEN_MESSAGES[screen_type] = message_id
-    logger.debug(f"📝 Updated {screen_type} message_id: {message_id}")
+    logger.debug("📝 Updated %s message_id: %s", screen_type, message_id)
@@ -193,40 +193,34 @@ def format_ticket_card(ticket) -> str:
             else ticket.messages
         )
 
+        # Sender labels resolved once per card, not per message
+        user_label = f"👤 {get_text('ui.user_label', lang=admin_lang)}"
+        support_label = f"🛠 {get_text('ui.support_label', lang=admin_lang)}"
+
         for msg in messages_to_show:
             try:
                 # Handle Message object
                 if hasattr(msg, "sender"):
-                    sender_label = (
-                        f"👤 {get_text('ui.user_label', lang=admin_lang)}"
-                        if msg.sender == "user"
-                        else f"🛠 {get_text('ui.support_label', lang=admin_lang)}"
-                    )
+                    sender = msg.sender
                     # Use 'at' field instead of 'timestamp'
                     timestamp = msg.at if hasattr(msg, "at") else datetime.now()
-                    time_str = _get_local_time(timestamp)
                     text = msg.text if hasattr(msg, "text") else str(msg)
-
-                    lines.append(f"{sender_label} [{time_str}]:")
-                    lines.append(f"{text}")
-                    lines.append("")
                 # Handle dict format
                 elif isinstance(msg, dict):
-                    sender_label = (
-                        f"👤 {get_text('ui.user_label', lang=admin_lang)}"
-                        if msg.get("sender") == "user"
-                        else f"🛠 {get_text('ui.support_label', lang=admin_lang)}"
-                    )
+                    sender = msg.get("sender")
                     timestamp = msg.get("at", datetime.now())
-                    time_str = _get_local_time(timestamp)
                     text = msg.get("text", "")
-
-                    lines.append(f"{sender_label} [{time_str}]:")
-                    lines.append(f"{text}")
-                    lines.append("")
                 else:
                     lines.append(f"• {str(msg)}")
                     lines.append("")
+                    continue
+
+                sender_label = user_label if sender == "user" else support_label
+                time_str = _get_local_time(timestamp)
+
+                lines.append(f"{sender_label} [{time_str}]:")
+                lines.append(f"{text}")
+                lines.append("")
             except Exception as e:
                 lines.append(f"• [Error displaying message: {e}]")
                 lines.append("")
@@ -1,13 +1,14 @@
+from functools import lru_cache
+
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-from locales import get_text, get_user_locale
-from config import DEFAULT_LOCALE
-from utils.locale_helper import get_admin_language
+from locales import get_text
+from config import AVAILABLE_LOCALES, DEFAULT_LOCALE
+from utils.locale_helper import get_admin_language, get_user_language
 
 
 def _get_user_lang(user_id: int) -> str:
-    """Get user language from locales module or use config default."""
-    lang = get_user_locale(user_id)
-    return lang if lang else DEFAULT_LOCALE
+    """Get user language through the cached locale_helper lookup."""
+    return get_user_language(user_id)
 
 
 def get_rating_keyboard(ticket_id: str, user_lang: str | None = None) -> InlineKeyboardMarkup:
@@ -38,7 +39,7 @@ def get_rating_keyboard(ticket_id: str, user_lang: str | None = None) -> InlineK
     )
 
 
-def get_settings_keyboard(user_lang: str | None = None) -> InlineKeyboardMarkup:
+def _build_settings_keyboard(user_lang: str | None = None) -> InlineKeyboardMarkup:
     """
     Build settings administration keyboard.
 
@@ -112,6 +113,7 @@ def get_settings_keyboard(user_lang: str | None = None) -> InlineKeyboardMarkup:
     )
 
 
+@lru_cache(maxsize=32)
 def get_language_keyboard(user_lang: str | None = None) -> InlineKeyboardMarkup:
     """
     Build language selection keyboard for admin.
@@ -142,6 +144,7 @@ def get_language_keyboard(user_lang: str | None = None) -> InlineKeyboardMarkup:
     )
 
 
+@lru_cache(maxsize=32)
 def get_user_language_keyboard(user_lang: str | None = None) -> InlineKeyboardMarkup:
     """
     Build language selection keyboard for regular user.
@@ -172,6 +175,7 @@ def get_user_language_keyboard(user_lang: str | None = None) -> InlineKeyboardMa
     )
 
 
+@lru_cache(maxsize=32)
 def get_admin_main_keyboard(user_lang: str | None = None) -> InlineKeyboardMarkup:
     """
     Build admin main menu keyboard.
@@ -236,3 +240,126 @@ def get_admin_help_keyboard(user_lang: str | None = None) -> InlineKeyboardMarku
             ],
         ]
     )
+
+
+# ===== Static single-purpose keyboards, prebuilt per locale =====
+
+def _build_back_to_settings_keyboard(lang: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        [[InlineKeyboardButton(get_text("buttons.back", lang=lang), callback_data="settings")]]
+    )
+
+
+def _build_main_menu_keyboard(lang: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        [[InlineKeyboardButton(get_text("buttons.main_menu", lang=lang), callback_data="admin_home")]]
+    )
+
+
+def _build_search_cancel_keyboard(lang: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        [[InlineKeyboardButton(get_text("search.button_cancel", lang=lang), callback_data="admin_inbox")]]
+    )
+
+
+def _build_rating_thanks_keyboard(lang: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton(
+                    get_text("buttons.write_suggestion", lang=lang),
+                    callback_data="after_rate_suggestion",
+                )
+            ],
+            [
+                InlineKeyboardButton(
+                    get_text("buttons.write_review", lang=lang),
+                    callback_data="after_rate_review",
+                )
+            ],
+            [
+                InlineKeyboardButton(
+                    get_text("buttons.cancel", lang=lang),
+                    callback_data="cancel_feedback_prompt",
+                )
+            ],
+        ]
+    )
+
+
+def _build_thanked_keyboard(lang: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        [[InlineKeyboardButton(get_text("admin.thanked", lang=lang), callback_data="noop")]]
+    )
+
+
+# {lang: InlineKeyboardMarkup}, filled by rebuild_ui_cache()
+SETTINGS_KB: dict[str, InlineKeyboardMarkup] = {}
+BACK_TO_SETTINGS_KB: dict[str, InlineKeyboardMarkup] = {}
+MAIN_MENU_KB: dict[str, InlineKeyboardMarkup] = {}
+SEARCH_CANCEL_KB: dict[str, InlineKeyboardMarkup] = {}
+RATING_THANKS_KB: dict[str, InlineKeyboardMarkup] = {}
+THANKED_KB: dict[str, InlineKeyboardMarkup] = {}
+
+_UI_CACHE_BUILDERS = (
+    (SETTINGS_KB, _build_settings_keyboard),
+    (BACK_TO_SETTINGS_KB, _build_back_to_settings_keyboard),
+    (MAIN_MENU_KB, _build_main_menu_keyboard),
+    (SEARCH_CANCEL_KB, _build_search_cancel_keyboard),
+    (RATING_THANKS_KB, _build_rating_thanks_keyboard),
+    (THANKED_KB, _build_thanked_keyboard),
+)
+
+# Locale-only keyboards memoized with lru_cache (markups are immutable)
+_LANG_CACHED_BUILDERS = (
+    get_language_keyboard,
+    get_user_language_keyboard,
+    get_admin_main_keyboard,
+)
+
+
+def rebuild_ui_cache() -> None:
+    """Build static keyboards for every available locale (call after locales reload)."""
+    for cache, builder in _UI_CACHE_BUILDERS:
+        cache.clear()
+        for lang in AVAILABLE_LOCALES:
+            cache[lang] = builder(lang)
+    for cached_builder in _LANG_CACHED_BUILDERS:
+        cached_builder.cache_clear()
+
+
+def _cached(cache: dict, user_lang: str | None) -> InlineKeyboardMarkup:
+    return cache.get(user_lang) or cache[DEFAULT_LOCALE]
+
+
+def get_settings_keyboard(user_lang: str | None = None) -> InlineKeyboardMarkup:
+    """Settings administration keyboard (prebuilt per locale)."""
+    return _cached(SETTINGS_KB, user_lang)
+
+
+def get_back_to_settings_keyboard(user_lang: str | None = None) -> InlineKeyboardMarkup:
+    """Single "Back" button returning to settings."""
+    return _cached(BACK_TO_SETTINGS_KB, user_lang)
+
+
+def get_main_menu_keyboard(user_lang: str | None = None) -> InlineKeyboardMarkup:
+    """Single "Main menu" button returning to admin home."""
+    return _cached(MAIN_MENU_KB, user_lang)
+
+
+def get_search_cancel_keyboard(user_lang: str | None = None) -> InlineKeyboardMarkup:
+    """Single "Cancel" button for ticket search prompt."""
+    return _cached(SEARCH_CANCEL_KB, user_lang)
+
+
+def get_rating_thanks_keyboard(user_lang: str | None = None) -> InlineKeyboardMarkup:
+    """Follow-up actions shown after user rated a ticket."""
+    return _cached(RATING_THANKS_KB, user_lang)
+
+
+def get_thanked_keyboard(user_lang: str | None = None) -> InlineKeyboardMarkup:
+    """Disabled "Thanked" button that replaces the thank action on feedback."""
+    return _cached(THANKED_KB, user_lang)
+
+
+rebuild_ui_cache()
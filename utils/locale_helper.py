@@ -7,20 +7,28 @@ Eliminates code duplication and ensures consistency.
 """
 
 import logging
-from typing import Optional
+from typing import Dict, Optional
 from config import DEFAULT_LOCALE, ADMIN_ID
 from locales import get_user_locale, set_user_locale as locales_set_user_locale
 from storage.data_manager import data_manager
 
 logger = logging.getLogger(__name__)
 
+# Resolved languages, kept in sync by set_user_language(): {user_id: lang_code}
+_user_languages: Dict[int, str] = {}
+# Resolved admin language (None until first lookup)
+_admin_language: Optional[str] = None
+
 
 def get_user_language(user_id: int) -> str:
     """
     Get user language with fallback chain:
-    1. User-specific locale (from memory cache)
+    1. Resolved language cache
     2. User data from storage (persistent)
-    3. Default locale from config
+    3. Locale from locales module (global fallback)
+    4. Default locale from config
+
+    Only explicit user preferences are cached, so fallbacks are re-evaluated.
 
     Args:
         user_id: Telegram user ID
@@ -28,20 +36,23 @@ def get_user_language(user_id: int) -> str:
     Returns:
         Language code (e.g., 'ru', 'en')
     """
-    try:
-        # Try memory cache first (fastest)
-        lang = get_user_locale(user_id)
-        if lang:
-            return lang
+    lang = _user_languages.get(user_id)
+    if lang:
+        return lang
 
+    try:
         # Try storage (persistent)
         user_data = data_manager.get_user_data(user_id)
         lang = user_data.get("locale")
         if lang:
-            locales_set_user_locale(user_id, lang)
+            _user_languages[user_id] = lang
+            return lang
+
+        lang = get_user_locale(user_id)
+        if lang:
             return lang
     except Exception as e:
-        logger.warning(f"Failed to load user locale for {user_id}: {e}")
+        logger.warning("Failed to load user locale for %s: %s", user_id, e)
 
     # Fallback to default
     return DEFAULT_LOCALE
@@ -49,17 +60,22 @@ def get_user_language(user_id: int) -> str:
 
 def get_admin_language() -> str:
     """
-    Get admin language from storage
+    Get admin language (cached after first storage lookup)
 
     Returns:
         Admin's language code or default
     """
+    global _admin_language
+
+    if _admin_language:
+        return _admin_language
+
     try:
         admin_data = data_manager.get_user_data(ADMIN_ID)
-        lang = admin_data.get("locale", DEFAULT_LOCALE)
-        return lang
+        _admin_language = admin_data.get("locale", DEFAULT_LOCALE)
+        return _admin_language
     except Exception as e:
-        logger.warning(f"Failed to load admin locale: {e}")
+        logger.warning("Failed to load admin locale: %s", e)
         return DEFAULT_LOCALE
 
 
@@ -67,6 +83,8 @@ def set_user_language(user_id: int, lang_code: str) -> bool:
     """
     Set user language with persistence
 
+    Also refreshes the cached language for this user (and admin).
+
     Args:
         user_id: Telegram user ID
         lang_code: Language code (ru, en, etc.)
@@ -74,11 +92,18 @@ def set_user_language(user_id: int, lang_code: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    global _admin_language
+
     try:
         locales_set_user_locale(user_id, lang_code)
         data_manager.update_user_data(user_id, {"locale": lang_code})
-        logger.info(f"Set language for user {user_id}: {lang_code}")
+
+        _user_languages[user_id] = lang_code
+        if user_id == ADMIN_ID:
+            _admin_language = lang_code
+
+        logger.info("Set language for user %s: %s", user_id, lang_code)
         return True
     except Exception as e:
-        logger.error(f"Failed to set language for user {user_id}: {e}")
+        logger.error("Failed to set language for user %s: %s", user_id, e)
         return False